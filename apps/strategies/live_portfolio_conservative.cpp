@@ -1386,28 +1386,35 @@ int main(int argc, char* argv[]) {
         std::unordered_map<std::string, std::unordered_map<std::string, Position>>
             previous_strategy_positions;
 
+        // Load every strategy's previous positions in one query, filtering by BOTH
+        // combined_strategy_id AND individual strategy_name to ensure we only get positions
+        // from this specific run
+        std::vector<std::string> strategy_names;
+        strategy_names.reserve(strategy_positions_map.size());
         for (const auto& [strategy_name, _] : strategy_positions_map) {
-            // Load previous positions filtering by BOTH combined_strategy_id AND individual
-            // strategy_name to ensure we only get positions from this specific run
-            auto prev_result =
-                db->load_positions_by_date(combined_strategy_id,  // Combined strategy_id
-                                           strategy_name,         // Individual strategy_name
-                                           coordinator_config.portfolio_id,  // Portfolio ID
-                                           previous_date, "trading.positions");
-
-            if (prev_result.is_ok()) {
-                previous_strategy_positions[strategy_name] = prev_result.value();
-                INFO("DEBUG PHASE 4: Loaded " + std::to_string(prev_result.value().size()) +
+            strategy_names.push_back(strategy_name);
+        }
+
+        auto prev_result = db->load_positions_by_date_for_strategies(
+            combined_strategy_id, strategy_names, coordinator_config.portfolio_id, previous_date,
+            "trading.positions");
+
+        if (prev_result.is_ok()) {
+            previous_strategy_positions = prev_result.value();
+            for (const auto& [strategy_name, prev_positions] : previous_strategy_positions) {
+                INFO("DEBUG PHASE 4: Loaded " + std::to_string(prev_positions.size()) +
                      " previous positions for strategy: " + strategy_name);
 
                 // Log individual previous positions for debugging
-                for (const auto& [symbol, pos] : prev_result.value()) {
+                for (const auto& [symbol, pos] : prev_positions) {
                     DEBUG("DEBUG PHASE 4: Previous " + strategy_name + " - " + symbol +
                           " qty=" + std::to_string(pos.quantity.as_double()));
                 }
-            } else {
-                INFO("No previous positions found for strategy: " + strategy_name +
-                     " (first run or no data): " + std::string(prev_result.error()->what()));
+            }
+        } else {
+            INFO("No previous positions found for strategies (first run or no data): " +
+                 std::string(prev_result.error()->what()));
+            for (const auto& strategy_name : strategy_names) {
                 previous_strategy_positions[strategy_name] = {};
             }
         }
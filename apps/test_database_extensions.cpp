@@ -1,9 +1,15 @@
 // Test program for database extensions
 // This verifies the new database methods work correctly
+//
+// It writes to and deletes from the real trading/backtest tables (including today's
+// LIVE_TREND_FOLLOWING row in trading.live_results), so it refuses to run unless
+// TRADE_NGIN_DB_SMOKE_TEST=1 is set explicitly.
 
 #include <chrono>
+#include <cstdlib>
 #include <fstream>
 #include <iostream>
+#include <random>
 #include <unordered_map>
 #include "trade_ngin/core/types.hpp"
 #include "trade_ngin/data/credential_store.hpp"
@@ -13,6 +19,13 @@
 using namespace trade_ngin;
 
 int main() {
+    const char* smoke_flag = std::getenv("TRADE_NGIN_DB_SMOKE_TEST");
+    if (smoke_flag == nullptr || std::string(smoke_flag) != "1") {
+        std::cerr << "This program modifies the configured database. "
+                  << "Set TRADE_NGIN_DB_SMOKE_TEST=1 to run it." << std::endl;
+        return 1;
+    }
+
     std::cout << "Testing Database Extensions...\n" << std::endl;
 
     // Load credentials from config.json
@@ -98,11 +111,15 @@ int main() {
     // Test 3: Test store_backtest_equity_curve_batch
     std::cout << "\nTest 3: store_backtest_equity_curve_batch..." << std::endl;
     std::vector<std::pair<Timestamp, double>> equity_points;
+    const int num_points = 10;
+    equity_points.reserve(num_points);
+    std::mt19937 rng(42);  // Single seeded engine so runs are reproducible
+    std::uniform_int_distribution<int> change_bps(-50, 49);
     double equity = 1000000.0;
-    for (int i = 0; i < 10; i++) {
-        auto timestamp = now - std::chrono::hours(24 * (10 - i));
-        equity *= (1.0 + (rand() % 100 - 50) / 10000.0);  // Random small changes
-        equity_points.push_back({timestamp, equity});
+    for (int i = 0; i < num_points; i++) {
+        auto timestamp = now - std::chrono::hours(24 * (num_points - i));
+        equity *= (1.0 + change_bps(rng) / 10000.0);  // Random small changes
+        equity_points.emplace_back(timestamp, equity);
     }
 
     auto equity_result =
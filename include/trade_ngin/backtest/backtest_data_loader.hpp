@@ -106,12 +106,17 @@ private:
     std::shared_ptr<PostgresDatabase> db_;
 
     /**
-     * @brief Load a batch of symbols
+     * @brief Fetch a batch of symbols from the database as an Arrow table
      */
-    Result<std::vector<Bar>> load_symbol_batch(
+    Result<std::shared_ptr<arrow::Table>> fetch_symbol_batch(
         const std::vector<std::string>& symbols,
         const DataLoadConfig& config);
 
+    /**
+     * @brief Convert a fetched batch to bars (does not touch the database)
+     */
+    static Result<std::vector<Bar>> convert_symbol_batch(std::shared_ptr<arrow::Table> table);
+
     /**
      * @brief Ensure database connection
      */
@@ -25,6 +25,14 @@ namespace ChartHelpers {
      * @return Formatted string (e.g., "1,234,567.89")
      */
     std::string format_currency(double value, int precision = 0);
+
+    /**
+     * @brief Select points to keep using Largest-Triangle-Three-Buckets downsampling
+     * @param values Y-values, assumed evenly spaced along the X-axis
+     * @param max_points Maximum number of points to keep (values below 3 keep everything)
+     * @return Sorted indices into values; always includes the first and last point
+     */
+    std::vector<size_t> lttb_indices(const std::vector<double>& values, size_t max_points);
 }
 
 /**
@@ -60,6 +68,7 @@ struct ChartConfig {
     double box_width = 0.8;               ///< Bar width (relative)
     bool rotate_x_labels = false;         ///< Rotate X-axis labels
     int x_label_angle = -45;              ///< X-axis label rotation angle
+    size_t max_points = 2000;             ///< Line charts are downsampled above this (0 = off)
 };
 
 /**
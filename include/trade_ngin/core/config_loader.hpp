@@ -2,7 +2,9 @@
 
 #pragma once
 
+#include <cctype>
 #include <filesystem>
+#include <map>
 #include <nlohmann/json.hpp>
 #include <string>
 #include <vector>
@@ -69,9 +71,38 @@ struct DatabaseConfig {
     std::string password;
     std::string name;
     size_t num_connections{5};
+    // Extra libpq connection parameters (e.g. sslmode, connect_timeout, application_name),
+    // appended to the connection URI as query parameters. libpq has no wire compression
+    std::map<std::string, std::string> connection_options;
 
     std::string get_connection_string() const {
-        return "postgresql://" + username + ":" + password + "@" + host + ":" + port + "/" + name;
+        std::string connection_string = "postgresql://" + uri_encode(username) + ":" +
+                                        uri_encode(password) + "@" + host + ":" + port + "/" +
+                                        uri_encode(name);
+        char separator = '?';
+        for (const auto& [key, value] : connection_options) {
+            connection_string += separator + uri_encode(key) + "=" + uri_encode(value);
+            separator = '&';
+        }
+        return connection_string;
+    }
+
+    // Percent-encode everything but RFC 3986 unreserved characters, so values containing
+    // spaces, '&', '=', '#', '%', '@' or '/' survive libpq's URI parsing
+    static std::string uri_encode(const std::string& value) {
+        static constexpr char hex_digits[] = "0123456789ABCDEF";
+        std::string encoded;
+        encoded.reserve(value.size());
+        for (unsigned char c : value) {
+            if (std::isalnum(c) || c == '-' || c == '.' || c == '_' || c == '~') {
+                encoded += static_cast<char>(c);
+            } else {
+                encoded += '%';
+                encoded += hex_digits[c >> 4];
+                encoded += hex_digits[c & 0x0F];
+            }
+        }
+        return encoded;
     }
 
     nlohmann::json to_json() const {
@@ -82,6 +113,7 @@ struct DatabaseConfig {
         j["password"] = password;
         j["name"] = name;
         j["num_connections"] = num_connections;
+        j["connection_options"] = connection_options;
         return j;
     }
 
@@ -98,6 +130,9 @@ struct DatabaseConfig {
             name = j.at("name").get<std::string>();
         if (j.contains("num_connections"))
             num_connections = j.at("num_connections").get<size_t>();
+        if (j.contains("connection_options"))
+            connection_options =
+                j.at("connection_options").get<std::map<std::string, std::string>>();
     }
 };
 
@@ -350,6 +385,15 @@ private:
      */
     static Result<AppConfig> extract_config(const nlohmann::json& merged);
 
+    /**
+     * @brief Override database settings from TRADING_DB_* environment variables
+     * @param database Database configuration (modified in place)
+     *
+     * Lets a deployment point at another server (e.g. a read replica) or keep credentials
+     * out of config files without editing them. Unset variables leave the file values alone.
+     */
+    static void apply_database_env_overrides(DatabaseConfig& database);
+
     /**
      * @brief Validate required fields after extraction
      * @param config Extracted AppConfig
@@ -2,8 +2,10 @@
 
 #include <condition_variable>
 #include <deque>
+#include <functional>
 #include <memory>
 #include <mutex>
+#include <random>
 #include <thread>
 #include <vector>
 #include "trade_ngin/data/postgres_database.hpp"
@@ -34,8 +36,10 @@ auto retry_with_backoff(Func func, int max_retries = 3) -> decltype(func()) {
         std::this_thread::sleep_for(delay);
 
         // Exponential backoff with jitter
+        thread_local std::mt19937 rng{std::random_device{}()};
+        std::uniform_int_distribution<int> jitter_ms(0, 99);
         delay *= 2;
-        delay += std::chrono::milliseconds(rand() % 100);
+        delay += std::chrono::milliseconds(jitter_ms(rng));
 
         attempt++;
     }
@@ -60,13 +64,30 @@ public:
         return pool;
     }
 
+    /**
+     * @brief Creates an unconnected database for a connection string; the pool calls connect()
+     */
+    using ConnectionFactory =
+        std::function<std::shared_ptr<PostgresDatabase>(const std::string& connection_string)>;
+
+    /**
+     * @brief Replace how the pool constructs its connections (defaults to PostgresDatabase)
+     * @param factory Factory used by initialize() and when the pool grows
+     */
+    void set_connection_factory(ConnectionFactory factory) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        connection_factory_ = std::move(factory);
+    }
+
     /**
      * @brief Initialize the database pool with a set of connections
      * @param connection_string Connection string for the database
      * @param pool_size Number of connections to create
+     * @param max_pool_size Upper bound the pool may grow to when callers are kept waiting
      * @return Result indicating success or failure
      */
-    Result<void> initialize(const std::string& connection_string, size_t pool_size = 5);
+    Result<void> initialize(const std::string& connection_string, size_t pool_size = 5,
+                            size_t max_pool_size = 20);
 
     /**
      * @brief Connection guard class for managing connection lifecycle
@@ -164,9 +185,11 @@ private:
     size_t max_pool_size_;
     std::string default_connection_string_;
     std::deque<std::shared_ptr<PostgresDatabase>> available_connections_;
+    ConnectionFactory connection_factory_;
     mutable std::mutex mutex_;
     std::condition_variable cv_;
 
+    std::shared_ptr<PostgresDatabase> make_database(const std::string& connection_string) const;
     std::shared_ptr<PostgresDatabase> create_new_connection();
 };
 
@@ -9,6 +9,8 @@
 #include <optional>
 #include <pqxx/pqxx>
 #include <string>
+#include <unordered_set>
+#include <utility>
 #include <vector>
 #include "trade_ngin/core/error.hpp"
 #include "trade_ngin/core/logger.hpp"
@@ -99,6 +101,24 @@ public:
         const std::string& portfolio_id, const Timestamp& date,
         const std::string& table_name = "trading.positions") override;
 
+    /**
+     * @brief Load positions by date for several strategies in a single query
+     * @param strategy_id Combined strategy identifier
+     * @param strategy_names Individual strategy names to load
+     * @param portfolio_id Portfolio identifier (e.g., BASE_PORTFOLIO, CONSERVATIVE_PORTFOLIO)
+     * @param date Date to load positions for
+     * @param table_name Name of the positions table
+     * @return Result containing map of strategy name to (symbol to position); every requested
+     *         strategy has an entry, empty if it had no positions. If the batched query fails,
+     *         strategies are loaded one by one and only strategies that also fail are left
+     *         empty; an error is returned only when every strategy fails
+     */
+    virtual Result<std::unordered_map<std::string, std::unordered_map<std::string, Position>>>
+    load_positions_by_date_for_strategies(const std::string& strategy_id,
+                                          const std::vector<std::string>& strategy_names,
+                                          const std::string& portfolio_id, const Timestamp& date,
+                                          const std::string& table_name = "trading.positions");
+
     /**
      * @brief Store execution reports in the database
      * @param executions List of execution reports
@@ -153,6 +173,11 @@ public:
                                                  DataFrequency freq = DataFrequency::DAILY,
                                                  const std::string& data_type = "ohlcv") override;
 
+    /**
+     * @brief Drop cached get_symbols results so the next call re-queries the database
+     */
+    void invalidate_symbols_cache();
+
     /**
      * @brief Execute a query and return the result as an Arrow table
      * @param query SQL query to execute
@@ -519,12 +544,49 @@ public:
      */
     Result<void> validate_table_name(const std::string& table_name) const;
 
+protected:
+    /**
+     * @brief Enable TCP keepalives on a libpq connection string unless the caller already
+     *        configured them, so long-lived connections to a remote host are not silently
+     *        dropped between batches
+     * @param connection_string Keyword/value or postgresql:// URI connection string
+     * @return Connection string with keepalive parameters appended when none were present
+     */
+    static std::string with_keepalive_options(const std::string& connection_string);
+
+    /**
+     * @brief Query the distinct symbols of a table, bypassing the symbols cache
+     * @param full_table_name Validated schema-qualified table name
+     * @return Result containing the sorted list of symbols
+     */
+    virtual Result<std::vector<std::string>> fetch_symbols(const std::string& full_table_name);
+
+    /**
+     * @brief Query the positions of several strategies on one day in a single round trip
+     * @return Result containing (strategy name, position) pairs for every matching row
+     */
+    virtual Result<std::vector<std::pair<std::string, Position>>> fetch_positions_for_strategies(
+        const std::string& strategy_id, const std::vector<std::string>& strategy_names,
+        const std::string& portfolio_id, const Timestamp& date, const std::string& table_name);
+
 private:
     std::string connection_string_;
     std::unique_ptr<pqxx::connection> connection_;
     std::mutex mutex_;
     std::string component_id_;
 
+    // Per-table symbol lists returned by get_symbols, reused for SYMBOLS_CACHE_TTL
+    struct CachedSymbols {
+        Timestamp fetched_at;
+        std::vector<std::string> symbols;
+    };
+    static constexpr std::chrono::hours SYMBOLS_CACHE_TTL{1};
+    std::unordered_map<std::string, CachedSymbols> symbols_cache_;
+    std::mutex symbols_cache_mutex_;
+
+    // Names of statements prepared on the current connection_; cleared whenever it is replaced
+    std::unordered_set<std::string> prepared_statements_;
+
     /**
      * @brief Validate the database connection
      * @return Result indicating success or failure
@@ -538,6 +600,21 @@ private:
      */
     std::string format_timestamp(const Timestamp& ts) const;
 
+    /**
+     * @brief Build an index-friendly "column falls on this day" condition
+     * @param column Date or timestamp column to filter
+     * @param day SQL expression for the day, e.g. a quoted 'YYYY-MM-DD' literal or $1
+     * @return Half-open range condition equivalent to DATE(column) = day
+     */
+    static std::string same_day_condition(const std::string& column, const std::string& day);
+
+    /**
+     * @brief Let a transaction that only writes regenerable backtest output commit without
+     *        waiting for the WAL flush
+     * @param txn Transaction to relax; must be called before its first write
+     */
+    static void relax_commit_durability(pqxx::work& txn);
+
     /**
      * @brief Convert a Side enum to a string
      * @param side Side to convert
@@ -243,15 +243,6 @@ private:
      */
     std::vector<double> ewma_standard_deviation(const std::vector<double>& prices, int N) const;
 
-    /**
-     * @brief Computes the long-term average of EWMA standard deviations.
-     * @param history Vector storing past EWMA standard deviations.
-     * @param max_history Maximum number of historical periods (default: 10 years).
-     * @return Long-term average EWMA standard deviation.
-     */
-    double compute_long_term_avg(const std::vector<double>& history,
-                                 size_t max_history = 2520) const;
-
     /**
      * @brief Calculate EMA crossover signals and scale by volatility
      * @param prices Price history for a symbol
@@ -2,6 +2,8 @@
 #include "trade_ngin/data/conversion_utils.hpp"
 #include "trade_ngin/core/logger.hpp"
 #include <algorithm>
+#include <future>
+#include <iterator>
 #include <set>
 
 namespace trade_ngin {
@@ -28,10 +30,30 @@ Result<std::vector<Bar>> BacktestDataLoader::load_market_data(const DataLoadConf
             "BacktestDataLoader");
     }
 
-    // Load market data in batches
+    // Load market data in batches. Converting a batch to bars is CPU work that does not
+    // touch the connection, so it runs in the background while the next batch is fetched.
     std::vector<Bar> all_bars;
     size_t batch_size = config.batch_size > 0 ? config.batch_size : 5;
 
+    std::future<Result<std::vector<Bar>>> pending_conversion;
+    std::string pending_range;
+
+    auto collect_pending = [&]() {
+        if (!pending_conversion.valid()) {
+            return;
+        }
+        auto batch_result = pending_conversion.get();
+        if (batch_result.is_error()) {
+            WARN("Error loading data for symbols batch " + pending_range + ": " +
+                 batch_result.error()->what() + ". Continuing with other batches.");
+            return;
+        }
+
+        auto& batch_bars = batch_result.value();
+        all_bars.insert(all_bars.end(), std::make_move_iterator(batch_bars.begin()),
+                        std::make_move_iterator(batch_bars.end()));
+    };
+
     for (size_t i = 0; i < config.symbols.size(); i += batch_size) {
         // Create a batch of symbols
         size_t end_idx = std::min(i + batch_size, config.symbols.size());
@@ -39,18 +61,23 @@ Result<std::vector<Bar>> BacktestDataLoader::load_market_data(const DataLoadConf
             config.symbols.begin() + i,
             config.symbols.begin() + end_idx);
 
-        // Load this batch
-        auto batch_result = load_symbol_batch(symbol_batch, config);
-        if (batch_result.is_error()) {
+        // Fetch this batch while the previous one is still being converted
+        auto fetch_result = fetch_symbol_batch(symbol_batch, config);
+        collect_pending();
+
+        if (fetch_result.is_error()) {
             WARN("Error loading data for symbols batch " + std::to_string(i) + "-" +
-                 std::to_string(end_idx) + ": " + batch_result.error()->what() +
+                 std::to_string(end_idx) + ": " + fetch_result.error()->what() +
                  ". Continuing with other batches.");
             continue;
         }
 
-        auto& batch_bars = batch_result.value();
-        all_bars.insert(all_bars.end(), batch_bars.begin(), batch_bars.end());
+        pending_range = std::to_string(i) + "-" + std::to_string(end_idx);
+        pending_conversion = std::async(std::launch::async,
+                                        &BacktestDataLoader::convert_symbol_batch,
+                                        fetch_result.value());
     }
+    collect_pending();
 
     // Check for empty data
     if (all_bars.empty()) {
@@ -180,7 +207,7 @@ std::unordered_map<std::string, double> BacktestDataLoader::get_price_statistics
     return stats;
 }
 
-Result<std::vector<Bar>> BacktestDataLoader::load_symbol_batch(
+Result<std::shared_ptr<arrow::Table>> BacktestDataLoader::fetch_symbol_batch(
     const std::vector<std::string>& symbols,
     const DataLoadConfig& config) {
     try {
@@ -189,7 +216,7 @@ Result<std::vector<Bar>> BacktestDataLoader::load_symbol_batch(
             config.asset_class, config.data_freq, config.data_type);
 
         if (result.is_error()) {
-            return make_error<std::vector<Bar>>(
+            return make_error<std::shared_ptr<arrow::Table>>(
                 result.error()->code(),
                 result.error()->what(),
                 "BacktestDataLoader");
@@ -197,14 +224,27 @@ Result<std::vector<Bar>> BacktestDataLoader::load_symbol_batch(
 
         auto arrow_table = result.value();
         if (arrow_table->num_rows() == 0) {
-            return make_error<std::vector<Bar>>(
+            return make_error<std::shared_ptr<arrow::Table>>(
                 ErrorCode::DATA_NOT_FOUND,
                 "Market data query returned an empty table",
                 "BacktestDataLoader");
         }
 
+        return Result<std::shared_ptr<arrow::Table>>(arrow_table);
+
+    } catch (const std::exception& e) {
+        return make_error<std::shared_ptr<arrow::Table>>(
+            ErrorCode::UNKNOWN_ERROR,
+            std::string("Exception loading market data: ") + e.what(),
+            "BacktestDataLoader");
+    }
+}
+
+Result<std::vector<Bar>> BacktestDataLoader::convert_symbol_batch(
+    std::shared_ptr<arrow::Table> table) {
+    try {
         // Convert Arrow table to Bars
-        auto conversion_result = DataConversionUtils::arrow_table_to_bars(arrow_table);
+        auto conversion_result = DataConversionUtils::arrow_table_to_bars(table);
         if (conversion_result.is_error()) {
             return make_error<std::vector<Bar>>(
                 conversion_result.error()->code(),
@@ -217,7 +257,7 @@ Result<std::vector<Bar>> BacktestDataLoader::load_symbol_batch(
     } catch (const std::exception& e) {
         return make_error<std::vector<Bar>>(
             ErrorCode::UNKNOWN_ERROR,
-            std::string("Exception loading market data: ") + e.what(),
+            std::string("Exception converting market data: ") + e.what(),
             "BacktestDataLoader");
     }
 }
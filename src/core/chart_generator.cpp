@@ -85,6 +85,62 @@ std::string ChartHelpers::format_currency(double value, int precision) {
     return s;
 }
 
+std::vector<size_t> ChartHelpers::lttb_indices(const std::vector<double>& values,
+                                               size_t max_points) {
+    const size_t n = values.size();
+    std::vector<size_t> indices;
+
+    if (max_points < 3 || n <= max_points) {
+        indices.resize(n);
+        for (size_t i = 0; i < n; ++i) indices[i] = i;
+        return indices;
+    }
+
+    indices.reserve(max_points);
+    indices.push_back(0);
+
+    // Interior points are split into (max_points - 2) buckets; from each bucket keep the point
+    // forming the largest triangle with the previously kept point and the next bucket's average
+    const double bucket_size = static_cast<double>(n - 2) / static_cast<double>(max_points - 2);
+    size_t prev = 0;
+
+    for (size_t b = 0; b < max_points - 2; ++b) {
+        size_t start = static_cast<size_t>(b * bucket_size) + 1;
+        size_t end = std::min(static_cast<size_t>((b + 1) * bucket_size) + 1, n - 1);
+
+        size_t next_start = end;
+        size_t next_end = std::min(static_cast<size_t>((b + 2) * bucket_size) + 1, n);
+        double avg_x = 0.0;
+        double avg_y = 0.0;
+        for (size_t j = next_start; j < next_end; ++j) {
+            avg_x += static_cast<double>(j);
+            avg_y += values[j];
+        }
+        const double count = static_cast<double>(std::max<size_t>(next_end - next_start, 1));
+        avg_x /= count;
+        avg_y /= count;
+
+        const double prev_x = static_cast<double>(prev);
+        const double prev_y = values[prev];
+        double max_area = -1.0;
+        size_t selected = start;
+        for (size_t j = start; j < end; ++j) {
+            double area = std::abs((prev_x - avg_x) * (values[j] - prev_y) -
+                                   (prev_x - static_cast<double>(j)) * (avg_y - prev_y));
+            if (area > max_area) {
+                max_area = area;
+                selected = j;
+            }
+        }
+
+        indices.push_back(selected);
+        prev = selected;
+    }
+
+    indices.push_back(n - 1);
+    return indices;
+}
+
 // ============================================================================
 // ChartGenerator Implementation - Data Fetchers
 // ============================================================================
@@ -215,37 +271,54 @@ ChartData ChartGenerator::fetch_equity_curve_data(
 
         // Sort data by date to find gaps
         std::vector<std::pair<std::string, double>> date_equity_pairs;
+        date_equity_pairs.reserve(dates.size());
         for (size_t i = 0; i < dates.size(); i++) {
             date_equity_pairs.push_back({dates[i], equity_values[i]});
         }
         std::sort(date_equity_pairs.begin(), date_equity_pairs.end());
 
+        // Parse a YYYY-MM-DD date once; the gap scan below compares each row to its neighbour
+        auto parse_date = [](const std::string& date_str,
+                             std::chrono::system_clock::time_point& out) {
+            std::tm tm = {};
+            std::istringstream ss(date_str);
+            ss >> std::get_time(&tm, "%Y-%m-%d");
+            if (ss.fail()) {
+                return false;
+            }
+            out = std::chrono::system_clock::from_time_t(std::mktime(&tm));
+            return true;
+        };
+
         // Find the most recent consecutive block of data (no gaps > 5 days)
         std::vector<std::pair<std::string, double>> recent_data;
         if (!date_equity_pairs.empty()) {
+            recent_data.reserve(date_equity_pairs.size());
             recent_data.push_back(date_equity_pairs.back());
 
-            // Work backwards to find consecutive data
-            for (int i = static_cast<int>(date_equity_pairs.size()) - 2; i >= 0; i--) {
-                std::tm tm1 = {}, tm2 = {};
-                std::istringstream ss1(date_equity_pairs[i].first);
-                std::istringstream ss2(recent_data.front().first);
-                ss1 >> std::get_time(&tm1, "%Y-%m-%d");
-                ss2 >> std::get_time(&tm2, "%Y-%m-%d");
-
-                if (!ss1.fail() && !ss2.fail()) {
-                    auto t1 = std::chrono::system_clock::from_time_t(std::mktime(&tm1));
-                    auto t2 = std::chrono::system_clock::from_time_t(std::mktime(&tm2));
-                    auto days_diff = std::chrono::duration_cast<std::chrono::hours>(t2 - t1).count() / 24;
-
-                    // If gap is more than 5 days, stop here
-                    if (days_diff > 5) {
-                        INFO("Found data gap of " + std::to_string(days_diff) + " days, using recent data only");
-                        break;
-                    }
-                    recent_data.insert(recent_data.begin(), date_equity_pairs[i]);
+            std::chrono::system_clock::time_point block_start;
+            bool block_start_valid = parse_date(date_equity_pairs.back().first, block_start);
+
+            // Work backwards to find consecutive data, collecting newest first
+            for (int i = static_cast<int>(date_equity_pairs.size()) - 2;
+                 i >= 0 && block_start_valid; i--) {
+                std::chrono::system_clock::time_point t1;
+                if (!parse_date(date_equity_pairs[i].first, t1)) {
+                    continue;
                 }
+
+                auto days_diff =
+                    std::chrono::duration_cast<std::chrono::hours>(block_start - t1).count() / 24;
+
+                // If gap is more than 5 days, stop here
+                if (days_diff > 5) {
+                    INFO("Found data gap of " + std::to_string(days_diff) + " days, using recent data only");
+                    break;
+                }
+                recent_data.push_back(date_equity_pairs[i]);
+                block_start = t1;
             }
+            std::reverse(recent_data.begin(), recent_data.end());
         }
 
         // Clear and repopulate with recent data only
@@ -1246,28 +1319,24 @@ namespace {
     }
 
     // Helper: Execute gnuplot script and return base64-encoded PNG
+    // The data is embedded in the script as the $data datablock, so renderers plot $data
+    // and no separate data file is written or re-read by gnuplot
     std::string execute_gnuplot(const std::string& script_content, const std::string& data_content) {
         // Create temporary files
-        std::string data_filename = "temp_chart_data.txt";
         std::string script_filename = "temp_chart_script.gnu";
         std::string chart_filename = "temp_chart_output.png";
 
-        // Write data file
-        std::ofstream data_file(data_filename);
-        if (!data_file.is_open()) {
-            ERROR("Failed to create temporary data file");
-            return "";
-        }
-        data_file << data_content;
-        data_file.close();
-
-        // Write script file
+        // Write script file with the inline datablock ahead of the plotting commands
         std::ofstream script_file(script_filename);
         if (!script_file.is_open()) {
             ERROR("Failed to create gnuplot script file");
             return "";
         }
-        script_file << script_content;
+        script_file << "$data << EOD\n" << data_content;
+        if (!data_content.empty() && data_content.back() != '\n') {
+            script_file << '\n';
+        }
+        script_file << "EOD\n" << script_content;
         script_file.close();
 
         // Execute gnuplot
@@ -1309,12 +1378,10 @@ namespace {
 
         // Cleanup (keep files for debugging if generation fails)
         if (!chart_data_bin.empty()) {
-            std::remove(data_filename.c_str());
             std::remove(script_filename.c_str());
             std::remove(chart_filename.c_str());
         } else {
             ERROR("Chart generation failed - keeping temp files for debugging:");
-            ERROR("  Data file: " + data_filename);
             ERROR("  Script file: " + script_filename);
             ERROR("  Output file: " + chart_filename);
         }
@@ -1336,11 +1403,12 @@ std::string ChartGenerator::render_line_chart(const ChartData& data, const Chart
     }
 
     try {
-        // Build data file content
+        // Build data file content, downsampling long series; the first and last points are
+        // always kept so the x-range and tick labels below are unaffected
         std::ostringstream data_content;
-        for (size_t i = 0; i < data.labels.size(); ++i) {
-            data_content << data.labels[i] << " " << std::fixed << std::setprecision(2)
-                        << data.values[i] << "\n";
+        data_content << std::fixed << std::setprecision(2);
+        for (size_t i : ChartHelpers::lttb_indices(data.values, config.max_points)) {
+            data_content << data.labels[i] << " " << data.values[i] << "\n";
         }
 
         // Build gnuplot script
@@ -1404,7 +1472,7 @@ std::string ChartGenerator::render_line_chart(const ChartData& data, const Chart
         }
 
         // Plot
-        script << "plot 'temp_chart_data.txt' using 1:2 with linespoints ls 1 notitle\n";
+        script << "plot $data using 1:2 with linespoints ls 1 notitle\n";
 
         return execute_gnuplot(script.str(), data_content.str());
 
@@ -1475,9 +1543,9 @@ std::string ChartGenerator::render_bar_chart(const ChartData& data, const ChartC
         // Bars with conditional color
         script << "set style fill solid border -1\n";
         script << "set boxwidth " << config.box_width << " relative\n";
-        script << "plot 'temp_chart_data.txt' using 1:($2>=0?$2:0) with boxes lc rgb '"
+        script << "plot $data using 1:($2>=0?$2:0) with boxes lc rgb '"
                << config.positive_color << "' notitle, \\\n";
-        script << "     'temp_chart_data.txt' using 1:($2<0?$2:0)  with boxes lc rgb '"
+        script << "     $data using 1:($2<0?$2:0)  with boxes lc rgb '"
                << config.negative_color << "' notitle\n";
 
         return execute_gnuplot(script.str(), data_content.str());
@@ -1556,13 +1624,13 @@ std::string ChartGenerator::render_horizontal_bar_chart(const ChartData& data, c
         // Plot with conditional coloring
         // For boxxy: using x_center:y_center:x_halfwidth:y_halfwidth
         // Plot positive values (from 0 to value)
-        script << "plot 'temp_chart_data.txt' using ($2 > 0 ? $2/2 : 1/0):($0):(abs($2)/2):(" << config.box_width/2
+        script << "plot $data using ($2 > 0 ? $2/2 : 1/0):($0):(abs($2)/2):(" << config.box_width/2
                << ") with boxxy lc rgb '" << config.positive_color << "' notitle, \\\n";
         // Plot negative values (from value to 0)
-        script << "     'temp_chart_data.txt' using ($2 < 0 ? $2/2 : 1/0):($0):(abs($2)/2):(" << config.box_width/2
+        script << "     $data using ($2 < 0 ? $2/2 : 1/0):($0):(abs($2)/2):(" << config.box_width/2
                << ") with boxxy lc rgb '" << config.negative_color << "' notitle, \\\n";
         // Plot zero values as tiny markers (ensures chart appears even when all PnL is zero)
-        script << "     'temp_chart_data.txt' using (abs($2) < 0.01 ? 0.1 : 1/0):($0):(0.1):(" << config.box_width/2
+        script << "     $data using (abs($2) < 0.01 ? 0.1 : 1/0):($0):(0.1):(" << config.box_width/2
                << ") with boxxy lc rgb '#cccccc' notitle\n";
 
         return execute_gnuplot(script.str(), data_content.str());
@@ -1684,7 +1752,7 @@ std::string ChartGenerator::render_pie_chart(const ChartData& data, const ChartC
             double percentage = (std::abs(data.values[i]) / total) * 100.0;
             
             // Each wedge as a filled polygon with legend
-            script << "'temp_chart_data.txt' index " << i << " ";
+            script << "$data index " << i << " ";
             script << "using 1:2 ";
             script << "with filledcurves xy=0,0 ";
             script << "lt " << ((i % colors.size()) + 1) << " ";
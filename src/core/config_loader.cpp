@@ -2,6 +2,7 @@
 
 #include "trade_ngin/core/config_loader.hpp"
 
+#include <cstdlib>
 #include <fstream>
 #include <iostream>
 
@@ -69,6 +70,7 @@ Result<AppConfig> ConfigLoader::extract_config(const nlohmann::json& merged) {
         if (merged.contains("database")) {
             config.database.from_json(merged.at("database"));
         }
+        apply_database_env_overrides(config.database);
 
         // Execution configuration
         if (merged.contains("execution")) {
@@ -148,6 +150,21 @@ Result<AppConfig> ConfigLoader::extract_config(const nlohmann::json& merged) {
     }
 }
 
+void ConfigLoader::apply_database_env_overrides(DatabaseConfig& database) {
+    auto override_from_env = [](const char* name, std::string& field) {
+        const char* value = std::getenv(name);
+        if (value && *value) {
+            field = value;
+        }
+    };
+
+    override_from_env("TRADING_DB_HOST", database.host);
+    override_from_env("TRADING_DB_PORT", database.port);
+    override_from_env("TRADING_DB_USERNAME", database.username);
+    override_from_env("TRADING_DB_PASSWORD", database.password);
+    override_from_env("TRADING_DB_NAME", database.name);
+}
+
 Result<void> ConfigLoader::validate_config(const AppConfig& config) {
     if (config.portfolio_id.empty()) {
         return make_error<void>(ErrorCode::INVALID_DATA, "Missing portfolio_id", "ConfigLoader");
@@ -283,6 +300,7 @@ Result<AppConfig> ConfigLoader::load_legacy(const std::filesystem::path& config_
         if (config_json.contains("database")) {
             config.database.from_json(config_json.at("database"));
         }
+        apply_database_env_overrides(config.database);
 
         // Email configuration
         if (config_json.contains("email")) {
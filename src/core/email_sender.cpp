@@ -507,6 +507,38 @@ bool is_agricultural_future(const std::string& symbol) {
     }
     return filtered;
 }
+
+// Helper function to compute the nth business day (Mon-Fri) of a month in one step
+// rather than walking forward a day at a time
+std::tm nth_business_day_of_month(int year, int month, int n) {
+    std::tm result{};
+    result.tm_year = year - 1900;
+    result.tm_mon = month - 1;
+    result.tm_mday = 1;
+    std::mktime(&result);
+
+    // Move to the first business day of the month
+    int day = 1;
+    int weekday = result.tm_wday;  // 0=Sunday, ..., 6=Saturday
+    if (weekday == 6) {
+        day += 2;
+        weekday = 1;
+    } else if (weekday == 0) {
+        day += 1;
+        weekday = 1;
+    }
+
+    // Advance the remaining business days: whole weeks, then skip a weekend if crossed
+    int remaining = std::max(n, 1) - 1;
+    day += (remaining / 5) * 7 + remaining % 5;
+    if (weekday + remaining % 5 > 5) {
+        day += 2;
+    }
+
+    result.tm_mday = day;
+    std::mktime(&result);
+    return result;
+}
 }  // namespace
 
 std::string EmailSender::generate_trading_report_body(
@@ -2042,13 +2074,6 @@ std::string EmailSender::format_symbols_table_for_positions(
                 } while (!is_business_day(tm));
                 return tm;
             };
-            auto get_next_business_day = [&is_business_day](std::tm tm) {
-                do {
-                    tm.tm_mday++;
-                    std::mktime(&tm);
-                } while (!is_business_day(tm));
-                return tm;
-            };
             auto get_last_day_of_month = [](int year, int month) {
                 std::tm r{};
                 r.tm_year = year - 1900;
@@ -2069,17 +2094,8 @@ std::string EmailSender::format_symbols_table_for_positions(
                 std::mktime(&r);
                 return r;
             };
-            auto get_nth_business_day = [&get_next_business_day](int year, int month, int n) {
-                std::tm r{};
-                r.tm_year = year - 1900;
-                r.tm_mon = month - 1;
-                r.tm_mday = 0;
-                int c = 0;
-                while (c < n) {
-                    r = get_next_business_day(r);
-                    c++;
-                }
-                return r;
+            auto get_nth_business_day = [](int year, int month, int n) {
+                return nth_business_day_of_month(year, month, n);
             };
 
             // Compute exchange-specific expiry for a given symbol/month/year
@@ -2454,15 +2470,6 @@ std::string EmailSender::format_rollover_warning(
         return tm;
     };
 
-    // Helper: Get next business day
-    auto get_next_business_day = [&is_business_day](std::tm tm) -> std::tm {
-        do {
-            tm.tm_mday++;
-            std::mktime(&tm);  // Normalize
-        } while (!is_business_day(tm));
-        return tm;
-    };
-
     // Helper: Get last day of month
     auto get_last_day_of_month = [](int year, int month) -> std::tm {
         std::tm result = {};
@@ -2474,18 +2481,8 @@ std::string EmailSender::format_rollover_warning(
     };
 
     // Helper: Get nth business day of month
-    auto get_nth_business_day = [&get_next_business_day](int year, int month, int n) -> std::tm {
-        std::tm result = {};
-        result.tm_year = year - 1900;
-        result.tm_mon = month - 1;
-        result.tm_mday = 0;  // Will increment to first day
-
-        int count = 0;
-        while (count < n) {
-            result = get_next_business_day(result);
-            count++;
-        }
-        return result;
+    auto get_nth_business_day = [](int year, int month, int n) -> std::tm {
+        return nth_business_day_of_month(year, month, n);
     };
 
     // Helper: Calculate days between two dates
@@ -2673,25 +2670,8 @@ std::string EmailSender::format_rollover_warning(
                             std::mktime(&r);
                             return r;
                         };
-                        auto get_next_business_day_local = [&is_business_day_local](std::tm tm) {
-                            do {
-                                tm.tm_mday++;
-                                std::mktime(&tm);
-                            } while (!is_business_day_local(tm));
-                            return tm;
-                        };
-                        auto get_nth_business_day_local = [&get_next_business_day_local](
-                                                              int year, int month, int n) {
-                            std::tm r{};
-                            r.tm_year = year - 1900;
-                            r.tm_mon = month - 1;
-                            r.tm_mday = 0;
-                            int c = 0;
-                            while (c < n) {
-                                r = get_next_business_day_local(r);
-                                c++;
-                            }
-                            return r;
+                        auto get_nth_business_day_local = [](int year, int month, int n) {
+                            return nth_business_day_of_month(year, month, n);
                         };
 
                         if (symbol == "GC" || symbol == "PL" || symbol == "SI") {
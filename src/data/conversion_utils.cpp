@@ -23,60 +23,80 @@ Result<std::vector<Bar>> DataConversionUtils::arrow_table_to_bars(
     }
 
     try {
-        // Get column arrays
-        auto time_array = table->GetColumnByName("time")->chunk(0);
-        auto symbol_array = table->GetColumnByName("symbol")->chunk(0);
-        auto open_array = table->GetColumnByName("open")->chunk(0);
-        auto high_array = table->GetColumnByName("high")->chunk(0);
-        auto low_array = table->GetColumnByName("low")->chunk(0);
-        auto close_array = table->GetColumnByName("close")->chunk(0);
-        auto volume_array = table->GetColumnByName("volume")->chunk(0);
+        std::vector<Bar> bars;
+        if (table->num_rows() == 0) {
+            return Result<std::vector<Bar>>(std::move(bars));
+        }
+
+        // Work on a single contiguous chunk per column so the typed arrays below can be
+        // cast once and indexed directly
+        std::shared_ptr<arrow::Table> source = table;
+        for (const auto& column : table->columns()) {
+            if (column->num_chunks() != 1) {
+                auto combined = table->CombineChunks();
+                if (!combined.ok()) {
+                    return make_error<std::vector<Bar>>(
+                        ErrorCode::CONVERSION_ERROR,
+                        "Failed to combine table chunks: " + combined.status().ToString(),
+                        "DataConversionUtils");
+                }
+                source = *combined;
+                break;
+            }
+        }
+
+        const int64_t num_rows = source->num_rows();
+
+        // Get typed column arrays once rather than casting per row
+        auto time_array = std::static_pointer_cast<arrow::TimestampArray>(
+            source->GetColumnByName("time")->chunk(0));
+        auto symbol_array = std::static_pointer_cast<arrow::StringArray>(
+            source->GetColumnByName("symbol")->chunk(0));
+        auto open_array = std::static_pointer_cast<arrow::DoubleArray>(
+            source->GetColumnByName("open")->chunk(0));
+        auto high_array = std::static_pointer_cast<arrow::DoubleArray>(
+            source->GetColumnByName("high")->chunk(0));
+        auto low_array = std::static_pointer_cast<arrow::DoubleArray>(
+            source->GetColumnByName("low")->chunk(0));
+        auto close_array = std::static_pointer_cast<arrow::DoubleArray>(
+            source->GetColumnByName("close")->chunk(0));
+        auto volume_array = std::static_pointer_cast<arrow::DoubleArray>(
+            source->GetColumnByName("volume")->chunk(0));
 
         // Prepare result vector
-        std::vector<Bar> bars;
-        bars.reserve(table->num_rows());
+        bars.reserve(num_rows);
 
         // Convert each row
-        for (int64_t i = 0; i < table->num_rows(); ++i) {
-            // Extract timestamp
-            auto ts_result = extract_timestamp(time_array, i);
-            if (ts_result.is_error()) {
+        for (int64_t i = 0; i < num_rows; ++i) {
+            if (time_array->IsNull(i)) {
                 return make_error<std::vector<Bar>>(
-                    ts_result.error()->code(), ts_result.error()->what(), "DataConversionUtils");
+                    ErrorCode::INVALID_DATA, "Null timestamp value at index " + std::to_string(i),
+                    "DataConversionUtils");
             }
 
-            // Extract symbol
-            auto symbol_result = extract_string(symbol_array, i);
-            if (symbol_result.is_error()) {
-                return make_error<std::vector<Bar>>(symbol_result.error()->code(),
-                                                    symbol_result.error()->what(),
-                                                    "DataConversionUtils");
+            if (symbol_array->IsNull(i)) {
+                return make_error<std::vector<Bar>>(
+                    ErrorCode::INVALID_DATA, "Null string value at index " + std::to_string(i),
+                    "DataConversionUtils");
             }
 
-            // Extract OHLCV values
-            auto open_result = extract_double(open_array, i);
-            auto high_result = extract_double(high_array, i);
-            auto low_result = extract_double(low_array, i);
-            auto close_result = extract_double(close_array, i);
-            auto volume_result = extract_double(volume_array, i);
-
-            // Check for errors in OHLCV extraction
-            if (open_result.is_error() || high_result.is_error() || low_result.is_error() ||
-                close_result.is_error() || volume_result.is_error()) {
+            // Check for nulls in OHLCV values
+            if (open_array->IsNull(i) || high_array->IsNull(i) || low_array->IsNull(i) ||
+                close_array->IsNull(i) || volume_array->IsNull(i)) {
                 return make_error<std::vector<Bar>>(
                     ErrorCode::CONVERSION_ERROR,
                     "Error extracting OHLCV values at row " + std::to_string(i),
                     "DataConversionUtils");
             }
 
-            // Create and add bar
-            Bar bar(ts_result.value(), open_result.value(), high_result.value(), low_result.value(),
-                    close_result.value(), volume_result.value(), symbol_result.value());
-
-            bars.push_back(bar);
+            // Create bar in place
+            bars.emplace_back(
+                std::chrono::system_clock::time_point(std::chrono::seconds(time_array->Value(i))),
+                open_array->Value(i), high_array->Value(i), low_array->Value(i),
+                close_array->Value(i), volume_array->Value(i), symbol_array->GetString(i));
         }
 
-        return Result<std::vector<Bar>>(bars);
+        return Result<std::vector<Bar>>(std::move(bars));
 
     } catch (const std::exception& e) {
         return make_error<std::vector<Bar>>(
@@ -1,8 +1,11 @@
 #include "trade_ngin/data/database_pooling.hpp"
+#include <algorithm>
+#include <future>
 
 namespace trade_ngin {
 
-Result<void> DatabasePool::initialize(const std::string& connection_string, size_t pool_size) {
+Result<void> DatabasePool::initialize(const std::string& connection_string, size_t pool_size,
+                                      size_t max_pool_size) {
     std::lock_guard<std::mutex> lock(mutex_);
 
     if (initialized_) {
@@ -15,13 +18,23 @@ Result<void> DatabasePool::initialize(const std::string& connection_string, size
     // Store connection string for later use
     default_connection_string_ = connection_string;
 
-    // Create connections
+    // Create connections concurrently so pool start-up costs one connection handshake
+    // rather than pool_size of them back to back
+    std::vector<std::shared_ptr<PostgresDatabase>> candidates;
+    std::vector<std::future<Result<void>>> pending;
+    candidates.reserve(pool_size);
+    pending.reserve(pool_size);
+    for (size_t i = 0; i < pool_size; ++i) {
+        auto db = make_database(connection_string);
+        pending.push_back(std::async(std::launch::async, [db]() { return db->connect(); }));
+        candidates.push_back(std::move(db));
+    }
+
     size_t successful_connections = 0;
     for (size_t i = 0; i < pool_size; ++i) {
-        auto db = std::make_shared<PostgresDatabase>(connection_string);
-        auto result = db->connect();
+        auto result = pending[i].get();
         if (result.is_ok()) {
-            available_connections_.push_back(db);
+            available_connections_.push_back(candidates[i]);
             successful_connections++;
         } else {
             ERROR("Failed to initialize connection in pool: " +
@@ -35,22 +48,32 @@ Result<void> DatabasePool::initialize(const std::string& connection_string, size
     }
 
     total_connections_ = successful_connections;
-    max_pool_size_ = pool_size;
+    max_pool_size_ = std::max(pool_size, max_pool_size);
     initialized_ = true;
-    INFO("Database pool initialized with " + std::to_string(pool_size) + " connections");
+    INFO("Database pool initialized with " + std::to_string(pool_size) +
+         " connections (max " + std::to_string(max_pool_size_) + ")");
 
     return Result<void>();
 }
 
+std::shared_ptr<PostgresDatabase> DatabasePool::make_database(
+    const std::string& connection_string) const {
+    if (connection_factory_) {
+        return connection_factory_(connection_string);
+    }
+    return std::make_shared<PostgresDatabase>(connection_string);
+}
+
 std::shared_ptr<PostgresDatabase> DatabasePool::create_new_connection() {
-    // Only call this with mutex already locked
-    if (total_connections() >= max_pool_size_) {
+    // Only call this with mutex already locked, so read the counter directly rather than
+    // through total_connections(), which takes the lock itself
+    if (total_connections_ >= max_pool_size_) {
         WARN("Maximum pool size reached (" + std::to_string(max_pool_size_) +
              "), cannot create new connections");
         return nullptr;
     }
 
-    auto db = std::make_shared<PostgresDatabase>(default_connection_string_);
+    auto db = make_database(default_connection_string_);
     auto result = db->connect();
     if (result.is_ok()) {
         total_connections_++;
@@ -81,7 +104,7 @@ DatabasePool::ConnectionGuard DatabasePool::acquire_connection(int max_retries,
                  "/" + std::to_string(max_retries) + ")");
 
             // Check if we need to create a new emergency connection
-            if (attempts == max_retries && total_connections() < max_pool_size_) {
+            if (attempts == max_retries && total_connections_ < max_pool_size_) {
                 INFO("Creating emergency connection to expand pool");
                 auto db = create_new_connection();
                 if (db) {
@@ -113,6 +136,8 @@ DatabasePool::ConnectionGuard DatabasePool::acquire_connection(int max_retries,
         auto reconnect_result = connection->connect();
         if (reconnect_result.is_error()) {
             ERROR("Failed to reconnect database: " + reconnect_result.error()->to_string());
+            // The stale connection is dropped, so it no longer counts against the pool size
+            total_connections_--;
             connection = create_new_connection();
         }
     }
@@ -134,7 +159,9 @@ Result<void> DatabasePool::return_connection(std::shared_ptr<PostgresDatabase> c
         auto result = connection->connect();
         if (result.is_error()) {
             ERROR("Failed to reconnect returned connection: " + result.error()->to_string());
-            // Don't return a bad connection to the pool
+            // Don't return a bad connection to the pool; free its slot so a replacement can
+            // be created on demand
+            total_connections_--;
             return Result<void>();
         }
     }
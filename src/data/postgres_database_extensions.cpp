@@ -2,6 +2,7 @@
 // Phase 0: Database Extensions to Replace Raw SQL
 // This file contains new methods to eliminate raw SQL from backtest and live trading
 
+#include <algorithm>
 #include <ctime>
 #include <iomanip>
 #include <sstream>
@@ -10,6 +11,11 @@
 
 namespace trade_ngin {
 
+namespace {
+// Maximum number of rows sent in a single multi-row INSERT statement
+constexpr size_t INSERT_PAGE_SIZE = 1000;
+}  // namespace
+
 // ============================================================================
 // NEW METHODS TO REPLACE RAW SQL (Phase 0 Refactoring)
 // ============================================================================
@@ -48,8 +54,8 @@ Result<void> PostgresDatabase::delete_stale_executions(const std::vector<std::st
             in_list += txn.quote(order_ids[i]);
         }
 
-        std::string query = "DELETE FROM " + table_name +
-                            " WHERE DATE(execution_time) = $1 "
+        std::string query = "DELETE FROM " + table_name + " WHERE " +
+                            same_day_condition("execution_time", "$1") +
                             " AND strategy_name = $2 "
                             " AND order_id IN (" +
                             in_list + ")";
@@ -165,21 +171,38 @@ Result<void> PostgresDatabase::store_backtest_equity_curve_batch(
     try {
         pqxx::work txn(*connection_);
 
+        relax_commit_durability(txn);
+
         std::string actual_portfolio_id = portfolio_id.empty() ? "BASE_PORTFOLIO" : portfolio_id;
 
-        // Build batch INSERT query
-        std::string query =
+        // Every row shares the run and portfolio ids, so quote them once
+        const std::string insert_prefix =
             "INSERT INTO " + table_name + " (run_id, portfolio_id, timestamp, equity) VALUES ";
+        const std::string row_prefix =
+            "(" + txn.quote(run_id) + ", " + txn.quote(actual_portfolio_id) + ", '";
+
+        // Send the points in bounded multi-row INSERTs so long runs don't build one huge
+        // statement
+        for (size_t page_start = 0; page_start < equity_points.size();
+             page_start += INSERT_PAGE_SIZE) {
+            size_t page_end = std::min(page_start + INSERT_PAGE_SIZE, equity_points.size());
+
+            std::string query = insert_prefix;
+            query.reserve(insert_prefix.size() +
+                          (page_end - page_start) * (row_prefix.size() + 48));
+            for (size_t i = page_start; i < page_end; ++i) {
+                if (i > page_start)
+                    query += ", ";
+                query += row_prefix;
+                query += format_timestamp(equity_points[i].first);
+                query += "', ";
+                query += std::to_string(equity_points[i].second);
+                query += ")";
+            }
 
-        for (size_t i = 0; i < equity_points.size(); ++i) {
-            if (i > 0)
-                query += ", ";
-            query += "(" + txn.quote(run_id) + ", " + txn.quote(actual_portfolio_id) + ", '" +
-                     format_timestamp(equity_points[i].first) + "', " +
-                     std::to_string(equity_points[i].second) + ")";
+            txn.exec(query);
         }
 
-        txn.exec(query);
         txn.commit();
 
         INFO("Stored " + std::to_string(equity_points.size()) +
@@ -218,6 +241,8 @@ Result<void> PostgresDatabase::store_backtest_positions(const std::vector<Positi
     try {
         pqxx::work txn(*connection_);
 
+        relax_commit_durability(txn);
+
         // Get the date from the first position (all positions should be from the same date)
         // Extract date from last_update timestamp
         auto time_t = std::chrono::system_clock::to_time_t(positions[0].last_update);
@@ -244,7 +269,8 @@ Result<void> PostgresDatabase::store_backtest_positions(const std::vector<Positi
             std::string delete_query = "DELETE FROM " + table_name +
                                        " WHERE run_id = " + txn.quote(actual_run_id_for_delete) +
                                        " AND strategy_id = " + txn.quote(strategy_id_for_delete) +
-                                       " AND DATE(date) = '" + position_date + "'";
+                                       " AND " +
+                                       same_day_condition("date", "'" + position_date + "'");
             txn.exec(delete_query);
         } catch (const std::exception& e) {
             // If date column doesn't exist yet (old schema), try without it
@@ -254,7 +280,7 @@ Result<void> PostgresDatabase::store_backtest_positions(const std::vector<Positi
                     "DELETE FROM " + table_name +
                     " WHERE run_id = " + txn.quote(actual_run_id_for_delete) +
                     " AND strategy_id = " + txn.quote(strategy_id_for_delete) +
-                    " AND DATE(last_update) = '" + position_date + "'";
+                    " AND " + same_day_condition("last_update", "'" + position_date + "'");
                 txn.exec(delete_query);
             } catch (const std::exception& e2) {
                 // If last_update doesn't exist either, skip delete (old schema)
@@ -272,65 +298,47 @@ Result<void> PostgresDatabase::store_backtest_positions(const std::vector<Positi
             " (run_id, portfolio_id, strategy_id, date, symbol, quantity, average_price, "
             "unrealized_pnl, realized_pnl, last_update, updated_at) VALUES ";
 
-        [[maybe_unused]] bool first = true;
-        std::vector<std::string> position_values;
+        // The run, portfolio and strategy ids are the same for every row, so split and quote
+        // them once rather than per position
+        const std::string row_prefix = "(" + txn.quote(actual_run_id_for_delete) + ", " +
+                                       txn.quote(actual_portfolio_id) + ", " +
+                                       txn.quote(strategy_id_for_delete) + ", '";
 
+        size_t position_count = 0;
         for (const auto& pos : positions) {
             // Skip zero positions
             if (std::abs(static_cast<double>(pos.quantity)) < 1e-10) {
                 continue;
             }
 
-            // Extract date from last_update timestamp
-            auto pos_time_t = std::chrono::system_clock::to_time_t(pos.last_update);
-            std::stringstream pos_date_ss;
-            std::tm pos_time_info;
-            trade_ngin::core::safe_gmtime(&pos_time_t, &pos_time_info);
-            pos_date_ss << std::put_time(&pos_time_info, "%Y-%m-%d");
-            std::string pos_date_str = pos_date_ss.str();
-
-            // Format timestamps
+            // Format timestamps; the date is the leading YYYY-MM-DD of last_update
             std::string last_update_str = format_timestamp(pos.last_update);
 
-            // Extract strategy_id from run_id if it contains a pipe separator
-            // Format: "backtest_run_id|strategy_id" OR just "strategy_id" for legacy
-            std::string actual_run_id = run_id;
-            std::string strategy_id_for_db = run_id;  // Default to run_id
-
-            size_t pipe_pos = run_id.find('|');
-            if (pipe_pos != std::string::npos) {
-                // New format: backtest_run_id|strategy_id
-                actual_run_id = run_id.substr(0, pipe_pos);
-                strategy_id_for_db = run_id.substr(pipe_pos + 1);
-            }
-
-            std::stringstream value_ss;
-            value_ss << "(" << txn.quote(actual_run_id) << ", " << txn.quote(actual_portfolio_id)
-                     << ", " << txn.quote(strategy_id_for_db) << ", "
-                     << "'" << pos_date_str << "', " << txn.quote(pos.symbol) << ", "
-                     << std::to_string(static_cast<double>(pos.quantity)) << ", "
-                     << std::to_string(static_cast<double>(pos.average_price)) << ", "
-                     << std::to_string(static_cast<double>(pos.unrealized_pnl)) << ", "
-                     << std::to_string(static_cast<double>(pos.realized_pnl)) << ", "
-                     << "'" << last_update_str << "', "
-                     << "'" << last_update_str << "'"
-                     << ")";
-
-            position_values.push_back(value_ss.str());
+            if (position_count > 0)
+                query += ", ";
+            query += row_prefix;
+            query.append(last_update_str, 0, 10);
+            query += "', ";
+            query += txn.quote(pos.symbol);
+            query += ", ";
+            query += std::to_string(static_cast<double>(pos.quantity));
+            query += ", ";
+            query += std::to_string(static_cast<double>(pos.average_price));
+            query += ", ";
+            query += std::to_string(static_cast<double>(pos.unrealized_pnl));
+            query += ", ";
+            query += std::to_string(static_cast<double>(pos.realized_pnl));
+            query += ", '";
+            query += last_update_str;
+            query += "', '";
+            query += last_update_str;
+            query += "')";
+            ++position_count;
         }
 
-        if (!position_values.empty()) {
+        if (position_count > 0) {
             // Try new schema first
             try {
-                // Join position values
-                bool first_val = true;
-                for (const auto& val : position_values) {
-                    if (!first_val)
-                        query += ", ";
-                    first_val = false;
-                    query += val;
-                }
-
                 DEBUG("Executing position insert query for run_id: " + run_id +
                       ", date: " + position_date);
                 DEBUG("Query: " + query.substr(0, 200) + "...");  // Log first 200 chars
@@ -338,7 +346,7 @@ Result<void> PostgresDatabase::store_backtest_positions(const std::vector<Positi
                 txn.exec(query);
                 txn.commit();
 
-                INFO("Successfully stored " + std::to_string(position_values.size()) +
+                INFO("Successfully stored " + std::to_string(position_count) +
                      " positions for run_id: " + run_id + " on date: " + position_date);
             } catch (const std::exception& e) {
                 // Log the actual error for debugging
@@ -394,42 +402,54 @@ Result<void> PostgresDatabase::store_backtest_positions_with_strategy(
     try {
         pqxx::work txn(*connection_);
 
+        relax_commit_durability(txn);
+
         std::string actual_portfolio_id = portfolio_id.empty() ? "BASE_PORTFOLIO" : portfolio_id;
 
         // Build batch INSERT query with strategy_id and all required columns
         // Schema requires: run_id, portfolio_id, strategy_id, date, symbol, quantity,
         // average_price,
         //                  unrealized_pnl, realized_pnl, last_update, updated_at
-        std::string query =
+        const std::string insert_prefix =
             "INSERT INTO " + table_name +
             " (run_id, portfolio_id, strategy_id, date, symbol, quantity, average_price, "
             "unrealized_pnl, realized_pnl, last_update, updated_at) VALUES ";
+        const std::string row_prefix = "(" + txn.quote(run_id) + ", " +
+                                       txn.quote(actual_portfolio_id) + ", " +
+                                       txn.quote(strategy_id) + ", '";
+
+        // A strategy's positions accumulate over the whole run, so send them in bounded
+        // multi-row INSERTs rather than one statement sized by the run length
+        std::string query;
+        size_t page_rows = 0;
+        size_t stored_rows = 0;
+        auto flush_page = [&]() {
+            if (page_rows == 0) {
+                return;
+            }
+            txn.exec(query);
+            stored_rows += page_rows;
+            page_rows = 0;
+        };
 
-        bool first = true;
         for (const auto& pos : positions) {
             // Skip zero positions
             if (std::abs(static_cast<double>(pos.quantity)) < 1e-10) {
                 continue;
             }
 
-            if (!first)
+            if (page_rows == 0) {
+                query = insert_prefix;
+            } else {
                 query += ", ";
-            first = false;
-
-            // Extract date from last_update timestamp (thread-safe)
-            auto time_t = std::chrono::system_clock::to_time_t(pos.last_update);
-            std::stringstream date_ss;
-            std::tm time_info;
-            trade_ngin::core::safe_gmtime(&time_t, &time_info);
-            date_ss << std::put_time(&time_info, "%Y-%m-%d");
-            std::string date_str = date_ss.str();
+            }
 
-            // Format timestamps using member function
+            // Format timestamps using member function; the date column is its YYYY-MM-DD prefix
             std::string last_update_str = format_timestamp(pos.last_update);
 
-            query += "(" + txn.quote(run_id) + ", " + txn.quote(actual_portfolio_id) + ", " +
-                     txn.quote(strategy_id) + ", " + "'" + date_str + "', " +  // date column
-                     txn.quote(pos.symbol) + ", " +
+            query += row_prefix;
+            query.append(last_update_str, 0, 10);
+            query += "', " + txn.quote(pos.symbol) + ", " +
                      std::to_string(static_cast<double>(pos.quantity)) + ", " +
                      std::to_string(static_cast<double>(pos.average_price)) + ", " +
                      std::to_string(static_cast<double>(pos.realized_pnl)) + ", " +
@@ -437,10 +457,14 @@ Result<void> PostgresDatabase::store_backtest_positions_with_strategy(
                      last_update_str + "', " +      // last_update
                      "'" + last_update_str + "'" +  // updated_at (same as last_update)
                      ")";
+
+            if (++page_rows == INSERT_PAGE_SIZE) {
+                flush_page();
+            }
         }
+        flush_page();
 
-        if (!first) {  // Only execute if we have non-zero positions
-            txn.exec(query);
+        if (stored_rows > 0) {  // Only commit if we have non-zero positions
             txn.commit();
 
             INFO("Stored " + std::to_string(positions.size()) +
@@ -501,8 +525,8 @@ Result<void> PostgresDatabase::update_live_results(
         }
 
         query += " WHERE strategy_id = " + txn.quote(strategy_id) +
-                 " AND portfolio_id = " + txn.quote(actual_portfolio_id) + " AND DATE(date) = '" +
-                 format_timestamp(date).substr(0, 10) + "'";
+                 " AND portfolio_id = " + txn.quote(actual_portfolio_id) + " AND " +
+                 same_day_condition("date", "'" + format_timestamp(date).substr(0, 10) + "'");
 
         auto result = txn.exec(query);
         txn.commit();
@@ -551,7 +575,9 @@ Result<void> PostgresDatabase::update_live_equity_curve(const std::string& strat
         std::string query = "UPDATE " + table_name + " SET equity = " + std::to_string(equity) +
                             " WHERE strategy_id = " + txn.quote(strategy_id) +
                             " AND portfolio_id = " + txn.quote(actual_portfolio_id) +
-                            " AND DATE(timestamp) = '" + format_timestamp(date).substr(0, 10) + "'";
+                            " AND " +
+                            same_day_condition("timestamp",
+                                               "'" + format_timestamp(date).substr(0, 10) + "'");
 
         auto result = txn.exec(query);
         txn.commit();
@@ -600,7 +626,9 @@ Result<void> PostgresDatabase::delete_live_results(const std::string& strategy_i
         std::string query = "DELETE FROM " + table_name +
                             " WHERE strategy_id = " + txn.quote(strategy_id) +
                             " AND portfolio_id = " + txn.quote(actual_portfolio_id) +
-                            " AND DATE(date) = '" + format_timestamp(date).substr(0, 10) + "'";
+                            " AND " +
+                            same_day_condition("date",
+                                               "'" + format_timestamp(date).substr(0, 10) + "'");
 
         auto result = txn.exec(query);
         txn.commit();
@@ -650,7 +678,9 @@ Result<void> PostgresDatabase::delete_live_equity_curve(const std::string& strat
         std::string query = "DELETE FROM " + table_name +
                             " WHERE strategy_id = " + txn.quote(strategy_id) +
                             " AND portfolio_id = " + txn.quote(actual_portfolio_id) +
-                            " AND DATE(timestamp) = '" + format_timestamp(date).substr(0, 10) + "'";
+                            " AND " +
+                            same_day_condition("timestamp",
+                                               "'" + format_timestamp(date).substr(0, 10) + "'");
 
         auto result = txn.exec(query);
         txn.commit();
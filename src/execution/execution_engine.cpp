@@ -6,6 +6,7 @@
 #include <iomanip>
 #include <iostream>
 #include <numeric>
+#include <random>
 #include <sstream>
 #include "trade_ngin/transaction_cost/transaction_cost_manager.hpp"
 #include "trade_ngin/core/logger.hpp"
@@ -480,13 +481,17 @@ Result<void> ExecutionEngine::execute_vwap(const ExecutionJob& job) {
         double total_volume = 0.0;
         double volume_weighted_price = 0.0;
 
+        // Per-thread engine for the simulated price jitter, avoiding the shared rand() state
+        thread_local std::mt19937 rng{std::random_device{}()};
+        std::uniform_real_distribution<double> price_jitter(-0.0005, 0.0005);
+
         // Generate child orders
         for (int i = 0; i < num_slices; ++i) {
             Order child = parent_order;
             child.quantity = Quantity(slice_size);
 
             // Adjust price slightly around parent price to simulate market impact
-            double price_adjustment = (static_cast<double>(rand()) / RAND_MAX - 0.5) * 0.001;
+            double price_adjustment = price_jitter(rng);
             child.price = Price(parent_order.price.as_double() * (1.0 + price_adjustment));
 
             auto submit_result = order_manager_->submit_order(child, "VWAP_" + job.job_id);
@@ -121,10 +121,12 @@ Result<std::string> CSVExporter::export_current_positions(
             << "forecast,volatility,ema_8,ema_32,ema_64,ema_256\n";
 
         // Get all tradeable symbols from strategy to include even zero positions
+        // Resolve the concrete strategy type once rather than for every row
+        auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
+        auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
+
         std::unordered_set<std::string> all_symbols;
         if (strategy != nullptr) {
-            auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-            auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
             if (tf_strategy != nullptr) {
                 const auto& instrument_data = tf_strategy->get_all_instrument_data();
                 for (const auto& [symbol, _] : instrument_data) {
@@ -175,8 +177,6 @@ Result<std::string> CSVExporter::export_current_positions(
             // TrendFollowingSlowStrategy)
             double forecast = 0.0;
             if (strategy != nullptr) {
-                auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-                auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
                 if (tf_strategy != nullptr) {
                     forecast = tf_strategy->get_forecast(symbol);
                 } else if (tf_slow_strategy != nullptr) {
@@ -187,8 +187,6 @@ Result<std::string> CSVExporter::export_current_positions(
             // Get volatility from strategy
             double volatility = 0.0;
             if (strategy != nullptr) {
-                auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-                auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
                 if (tf_strategy != nullptr) {
                     auto instrument_data = tf_strategy->get_instrument_data(symbol);
                     if (instrument_data != nullptr) {
@@ -205,8 +203,6 @@ Result<std::string> CSVExporter::export_current_positions(
             // Get EMA values
             double ema_8 = 0.0, ema_32 = 0.0, ema_64 = 0.0, ema_256 = 0.0;
             if (strategy != nullptr) {
-                auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-                auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
                 if (tf_strategy != nullptr) {
                     auto ema_values = tf_strategy->get_ema_values(symbol, {8, 32, 64, 256});
                     ema_8 = ema_values.count(8) ? ema_values[8] : 0.0;
@@ -499,10 +495,12 @@ Result<std::string> CSVExporter::export_current_positions(
             }
 
             // Get all tradeable symbols from strategy to include even zero positions
+            // Resolve the concrete strategy type once rather than for every row
+            auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
+            auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
+
             std::unordered_set<std::string> all_symbols;
             if (strategy != nullptr) {
-                auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-                auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
                 if (tf_strategy != nullptr) {
                     const auto& instrument_data = tf_strategy->get_all_instrument_data();
                     for (const auto& [symbol, _] : instrument_data) {
@@ -551,8 +549,6 @@ Result<std::string> CSVExporter::export_current_positions(
                 // Get forecast from strategy
                 double forecast = 0.0;
                 if (strategy != nullptr) {
-                    auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-                    auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
                     if (tf_strategy != nullptr) {
                         forecast = tf_strategy->get_forecast(symbol);
                     } else if (tf_slow_strategy != nullptr) {
@@ -563,8 +559,6 @@ Result<std::string> CSVExporter::export_current_positions(
                 // Get volatility from strategy
                 double volatility = 0.0;
                 if (strategy != nullptr) {
-                    auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-                    auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
                     if (tf_strategy != nullptr) {
                         auto instrument_data = tf_strategy->get_instrument_data(symbol);
                         if (instrument_data != nullptr) {
@@ -581,8 +575,6 @@ Result<std::string> CSVExporter::export_current_positions(
                 // Get EMA values
                 double ema_8 = 0.0, ema_32 = 0.0, ema_64 = 0.0, ema_256 = 0.0;
                 if (strategy != nullptr) {
-                    auto* tf_strategy = dynamic_cast<TrendFollowingStrategy*>(strategy);
-                    auto* tf_slow_strategy = dynamic_cast<TrendFollowingSlowStrategy*>(strategy);
                     if (tf_strategy != nullptr) {
                         auto ema_values = tf_strategy->get_ema_values(symbol, {8, 32, 64, 256});
                         ema_8 = ema_values.count(8) ? ema_values[8] : 0.0;
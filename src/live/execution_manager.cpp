@@ -1,6 +1,8 @@
 #include "trade_ngin/live/execution_manager.hpp"
 #include "trade_ngin/core/logger.hpp"
+#include "trade_ngin/core/time_utils.hpp"
 #include <cmath>
+#include <ctime>
 #include <sstream>
 #include <iomanip>
 
@@ -14,6 +16,7 @@ Result<std::vector<ExecutionReport>> ExecutionManager::generate_daily_executions
 
     INFO("Generating execution reports for position changes...");
     std::vector<ExecutionReport> daily_executions;
+    daily_executions.reserve(current_positions.size() + previous_positions.size());
 
     // Handle existing positions that changed
     for (const auto& [symbol, current_position] : current_positions) {
@@ -46,12 +49,12 @@ Result<std::vector<ExecutionReport>> ExecutionManager::generate_daily_executions
             // Generate execution
             ExecutionReport exec = generate_execution(
                 symbol, trade_size, market_price, timestamp, daily_executions.size());
-            daily_executions.push_back(exec);
 
             INFO("Generated execution: " + symbol + " " +
                  (exec.side == Side::BUY ? "BUY" : "SELL") + " " +
                  std::to_string(exec.filled_quantity) + " at " +
                  std::to_string(exec.fill_price));
+            daily_executions.push_back(std::move(exec));
         }
     }
 
@@ -75,17 +78,17 @@ Result<std::vector<ExecutionReport>> ExecutionManager::generate_daily_executions
             double trade_size = -prev_qty; // Negative because we're closing
             ExecutionReport exec = generate_execution(
                 symbol, trade_size, market_price, timestamp, daily_executions.size());
-            daily_executions.push_back(exec);
 
             INFO("Generated execution for closed position: " + symbol + " " +
                  (exec.side == Side::BUY ? "BUY" : "SELL") + " " +
                  std::to_string(exec.filled_quantity) + " at " +
                  std::to_string(exec.fill_price));
+            daily_executions.push_back(std::move(exec));
         }
     }
 
     INFO("Generated " + std::to_string(daily_executions.size()) + " execution reports");
-    return Result<std::vector<ExecutionReport>>(daily_executions);
+    return Result<std::vector<ExecutionReport>>(std::move(daily_executions));
 }
 
 ExecutionReport ExecutionManager::generate_execution(
@@ -159,15 +162,13 @@ void ExecutionManager::update_market_data(const std::string& symbol, double volu
 std::string ExecutionManager::generate_date_string(const Timestamp& timestamp) {
     // Convert timestamp to time_t
     std::time_t time = std::chrono::system_clock::to_time_t(timestamp);
-    std::tm* tm = std::localtime(&time);
-
-    // Create date string in YYYYMMDD format
-    std::stringstream date_ss;
-    date_ss << std::setfill('0')
-            << std::setw(4) << (tm->tm_year + 1900)
-            << std::setw(2) << (tm->tm_mon + 1)
-            << std::setw(2) << tm->tm_mday;
-    return date_ss.str();
+    std::tm tm{};
+    core::safe_localtime(&time, &tm);
+
+    // Create date string in YYYYMMDD format without going through a stringstream
+    char buffer[16];
+    std::strftime(buffer, sizeof(buffer), "%Y%m%d", &tm);
+    return std::string(buffer);
 }
 
 std::string ExecutionManager::generate_exec_id(
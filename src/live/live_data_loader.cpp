@@ -743,19 +743,18 @@ Result<std::vector<Position>> LiveDataLoader::load_positions(const std::string&
         return Result<std::vector<Position>>(positions);
     }
 
-    // Extract positions from result
+    // Extract positions from result; the column arrays are the same for every row, so cast
+    // them once up front
+    auto symbol_array = std::static_pointer_cast<arrow::StringArray>(table->column(0)->chunk(0));
+    auto qty_array = std::static_pointer_cast<arrow::DoubleArray>(table->column(1)->chunk(0));
+    auto price_array = std::static_pointer_cast<arrow::DoubleArray>(table->column(2)->chunk(0));
+    auto realized_array = std::static_pointer_cast<arrow::DoubleArray>(table->column(3)->chunk(0));
+    auto unrealized_array =
+        std::static_pointer_cast<arrow::DoubleArray>(table->column(4)->chunk(0));
+
+    positions.reserve(static_cast<size_t>(table->num_rows()));
     for (int64_t i = 0; i < table->num_rows(); ++i) {
         Position pos;
-
-        auto symbol_array =
-            std::static_pointer_cast<arrow::StringArray>(table->column(0)->chunk(0));
-        auto qty_array = std::static_pointer_cast<arrow::DoubleArray>(table->column(1)->chunk(0));
-        auto price_array = std::static_pointer_cast<arrow::DoubleArray>(table->column(2)->chunk(0));
-        auto realized_array =
-            std::static_pointer_cast<arrow::DoubleArray>(table->column(3)->chunk(0));
-        auto unrealized_array =
-            std::static_pointer_cast<arrow::DoubleArray>(table->column(4)->chunk(0));
-
         pos.symbol = symbol_array->GetString(i);
         pos.quantity = Decimal(qty_array->Value(i));
         pos.average_price = Decimal(price_array->Value(i));
@@ -763,7 +762,7 @@ Result<std::vector<Position>> LiveDataLoader::load_positions(const std::string&
         pos.unrealized_pnl =
             Decimal(unrealized_array->IsNull(i) ? 0.0 : unrealized_array->Value(i));
 
-        positions.push_back(pos);
+        positions.push_back(std::move(pos));
     }
 
     INFO("Loaded " + std::to_string(positions.size()) + " positions for " + date_ss.str());
@@ -711,30 +711,29 @@ std::vector<double> TrendFollowingFastStrategy::ewma_standard_deviation(
     }
 
     std::vector<double> ewma_stddev(returns.size(), 0.0);
-    std::vector<double> ewma_mean(returns.size(), 0.0);
-    std::vector<double> ewma_variance(returns.size(), 0.0);
 
-    double lambda = 2.0 / (window + 1);                // Compute lambda
-    ewma_mean[0] = returns[0];                         // Initialize EWMA mean
-    ewma_variance[0] = returns[0] * returns[0] * 0.1;  // Initial variance is zero
+    // Only the previous mean and variance feed each step, so keep them as running scalars
+    double lambda = 2.0 / (window + 1);                   // Compute lambda
+    double ewma_mean = returns[0];                        // Initialize EWMA mean
+    double ewma_variance = returns[0] * returns[0] * 0.1;  // Initial variance is zero
 
     for (size_t t = 1; t < returns.size(); ++t) {
         // Update EWMA mean
-        ewma_mean[t] = lambda * returns[t] + (1 - lambda) * ewma_mean[t - 1];
+        ewma_mean = lambda * returns[t] + (1 - lambda) * ewma_mean;
 
         // Calculate deviation
-        double deviation = returns[t] - ewma_mean[t];
+        double deviation = returns[t] - ewma_mean;
         if (std::isnan(deviation) || std::isinf(deviation)) {
             deviation = 0.0;  // Use a neutral value
         }
 
         // Update EWMA variance
-        ewma_variance[t] = lambda * (deviation * deviation) + (1 - lambda) * ewma_variance[t - 1];
+        ewma_variance = lambda * (deviation * deviation) + (1 - lambda) * ewma_variance;
 
         // Ensure variance is positive
-        ewma_variance[t] = std::max(0.000001, ewma_variance[t]);
+        ewma_variance = std::max(0.000001, ewma_variance);
 
-        ewma_stddev[t] = std::sqrt(ewma_variance[t]);
+        ewma_stddev[t] = std::sqrt(ewma_variance);
 
         // Annualize the standard deviation
         ewma_stddev[t] *= 16.0;  // Multiply by sqrt(256) for 256 trading days
@@ -750,40 +749,9 @@ std::vector<double> TrendFollowingFastStrategy::ewma_standard_deviation(
     // Handle first element
     ewma_stddev[0] = ewma_stddev[1];
 
-    // Add a final element to match the size of the price vector if needed
-    // (returns vector is one element shorter than prices)
-    std::vector<double> result(prices.size(), 0.0);
-    for (size_t i = 0; i < ewma_stddev.size(); ++i) {
-        result[i + 1] = ewma_stddev[i];
-    }
-    result[0] = result[1];  // Copy first valid value
-
     return ewma_stddev;
 }
 
-double TrendFollowingFastStrategy::compute_long_term_avg(const std::vector<double>& history,
-                                                         size_t max_history) const {
-    if (history.empty())
-        return 0.001;  // Return a small non-zero value instead of 0.0
-
-    size_t start_index = history.size() > max_history ? history.size() - max_history : 0;
-    double sum = std::accumulate(history.begin() + start_index, history.end(), 0.0);
-
-    // Ensure we don't divide by zero
-    size_t count = history.size() - start_index;
-    if (count == 0)
-        return 0.001;
-
-    double result = sum / count;
-
-    // Sanity check on the result
-    if (std::isnan(result) || std::isinf(result) || result <= 0.0) {
-        return 0.001;  // Return a safe default
-    }
-
-    return result;
-}
-
 std::vector<double> TrendFollowingFastStrategy::blended_ewma_stddev(
     const std::vector<double>& prices, int window, double weight_short, double weight_long,
     size_t max_history) const {
@@ -823,6 +791,11 @@ std::vector<double> TrendFollowingFastStrategy::blended_ewma_stddev(
 
     std::vector<double> blended_stddev(prices.size(), 0.0);
     std::vector<double> history;  // Stores past short-term EWMA standard deviations
+    history.reserve(prices.size());
+
+    // Running sum over the last max_history entries of history, so the long-term
+    // average is O(1) per step instead of re-summing the window every iteration
+    double window_sum = 0.0;
 
     // Apply floor to avoid division by zero or very small values
     const double MIN_STDDEV = 0.005;
@@ -836,7 +809,20 @@ std::vector<double> TrendFollowingFastStrategy::blended_ewma_stddev(
             history.push_back(MIN_STDDEV);  // Store a safe value
         }
 
-        double long_term_avg = compute_long_term_avg(history, max_history);
+        window_sum += history.back();
+        if (max_history > 0 && history.size() > max_history) {
+            window_sum -= history[history.size() - 1 - max_history];
+        }
+
+        // Mean of the last max_history entries, falling back to 0.001 if degenerate
+        double long_term_avg = 0.001;
+        size_t count = std::min(history.size(), max_history);
+        if (count > 0) {
+            double avg = window_sum / count;
+            if (!std::isnan(avg) && !std::isinf(avg) && avg > 0.0) {
+                long_term_avg = avg;
+            }
+        }
         // Ensure long term average is also valid
         long_term_avg = std::max(MIN_STDDEV, long_term_avg);
 
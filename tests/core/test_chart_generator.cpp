@@ -0,0 +1,52 @@
+// Coverage for ChartHelpers in chart_generator.cpp. Targets:
+// - lttb_indices passthrough when the series fits within max_points
+// - lttb_indices output size, ordering and endpoint retention when downsampling
+// - lttb_indices keeps isolated spikes
+
+#include <gtest/gtest.h>
+#include <algorithm>
+#include <cmath>
+#include <vector>
+#include "trade_ngin/core/chart_generator.hpp"
+
+using namespace trade_ngin;
+
+class ChartHelpersTest : public ::testing::Test {};
+
+// ===== lttb_indices =====
+
+TEST_F(ChartHelpersTest, LttbKeepsAllPointsWhenUnderLimit) {
+    std::vector<double> values = {1.0, 2.0, 3.0, 4.0};
+    auto indices = ChartHelpers::lttb_indices(values, 10);
+    ASSERT_EQ(indices.size(), values.size());
+    for (size_t i = 0; i < indices.size(); ++i) {
+        EXPECT_EQ(indices[i], i);
+    }
+}
+
+TEST_F(ChartHelpersTest, LttbZeroLimitDisablesDownsampling) {
+    std::vector<double> values(100, 1.0);
+    EXPECT_EQ(ChartHelpers::lttb_indices(values, 0).size(), values.size());
+}
+
+TEST_F(ChartHelpersTest, LttbDownsamplesToLimitAndKeepsEndpoints) {
+    std::vector<double> values(10000);
+    for (size_t i = 0; i < values.size(); ++i) {
+        values[i] = std::sin(static_cast<double>(i) / 100.0);
+    }
+
+    auto indices = ChartHelpers::lttb_indices(values, 500);
+    ASSERT_EQ(indices.size(), 500u);
+    EXPECT_EQ(indices.front(), 0u);
+    EXPECT_EQ(indices.back(), values.size() - 1);
+    EXPECT_TRUE(std::is_sorted(indices.begin(), indices.end()));
+    EXPECT_EQ(std::adjacent_find(indices.begin(), indices.end()), indices.end());
+}
+
+TEST_F(ChartHelpersTest, LttbKeepsIsolatedSpike) {
+    std::vector<double> values(1000, 100.0);
+    values[437] = 500.0;
+
+    auto indices = ChartHelpers::lttb_indices(values, 50);
+    EXPECT_NE(std::find(indices.begin(), indices.end(), 437u), indices.end());
+}
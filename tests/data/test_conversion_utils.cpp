@@ -1,5 +1,6 @@
 // Coverage for conversion_utils.cpp. Targets:
 // - arrow_table_to_bars happy path (full row conversion)
+// - Multi-chunk tables (every chunk is converted)
 // - Missing required column (returns INVALID_DATA)
 // - Null table pointer (returns INVALID_ARGUMENT)
 // - extract_timestamp / extract_double / extract_string error paths
@@ -104,6 +105,20 @@ TEST_F(ConversionUtilsTest, ValidTableProducesBars) {
     EXPECT_DOUBLE_EQ(r.value()[2].close.to_double(), 102.5);
 }
 
+TEST_F(ConversionUtilsTest, MultiChunkTableConvertsAllRows) {
+    auto first = build_table(2);
+    auto second = build_table(3);
+    auto combined = arrow::ConcatenateTables({first, second});
+    ASSERT_TRUE(combined.ok());
+    ASSERT_EQ((*combined)->column(0)->num_chunks(), 2);
+
+    auto r = DataConversionUtils::arrow_table_to_bars(*combined);
+    ASSERT_TRUE(r.is_ok()) << (r.error() ? r.error()->what() : "");
+    ASSERT_EQ(r.value().size(), 5u);
+    EXPECT_DOUBLE_EQ(r.value()[1].open.to_double(), 101.0);
+    EXPECT_DOUBLE_EQ(r.value()[4].close.to_double(), 102.5);
+}
+
 TEST_F(ConversionUtilsTest, NullValueInOhlcvReturnsConversionError) {
     auto t = build_table(2, /*null_open=*/true);
     auto r = DataConversionUtils::arrow_table_to_bars(t);
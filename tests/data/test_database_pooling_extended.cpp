@@ -4,28 +4,36 @@
 //   (returns CONNECTION_ERROR after 0 successful connections)
 // - DatabasePool::return_connection with nullptr
 // - retry_with_backoff template (header) on success and on retryable failure
-//
-// We deliberately avoid testing acquire_connection / multi-connection paths
-// because those require a working PostgresDatabase, which the existing
-// MockPostgresDatabase doesn't substitute for inside DatabasePool (it
-// constructs std::make_shared<PostgresDatabase> directly). Captured here as
-// a deferred-refactor item; see deliverables/unit_testing/postgres_database.md.
+// - acquire_connection growing the pool up to max_pool_size, and the
+//   connection count after a failed reconnect, using a connection factory
+//   that hands out ControlledDatabase instances instead of real connections
 
 #include <gtest/gtest.h>
 #include <atomic>
 #include <chrono>
+#include <condition_variable>
+#include <cstdlib>
+#include <deque>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <random>
+#include <thread>
+#include <vector>
+#include "trade_ngin/data/postgres_database.hpp"
+
+// Expose the private constructor so each test gets its own pool rather than the singleton
+#define private public
 #include "trade_ngin/data/database_pooling.hpp"
+#undef private
 
 using namespace trade_ngin;
 
 class DatabasePoolingExtendedTest : public ::testing::Test {};
 
-// NOTE: We deliberately don't exercise retry_with_backoff retry paths here.
-// That helper calls std::rand() without seeding, which advances the global
-// RNG state and breaks downstream tests (e.g.
-// TransactionCostAnalyzerTest.ImplementationShortfall) that also rely on
-// rand(). Captured as a FIXME on the production retry helper —
-// it should use a local std::mt19937 with its own seed.
+// NOTE: retry_with_backoff draws its jitter from a thread_local std::mt19937,
+// so exercising its retry path must leave the global rand() sequence (which
+// e.g. TransactionCostAnalyzerTest.ImplementationShortfall relies on) intact.
 
 // ===== initialize fails when all connections fail =====
 
@@ -78,6 +86,110 @@ TEST_F(DatabasePoolingExtendedTest, RetryWithBackoffStopsRetryingOnNonRetryableE
     EXPECT_EQ(calls.load(), 1);  // not a CONNECTION_ERROR → no retries
 }
 
-// Retry-path tests for retry_with_backoff are intentionally omitted: the
-// helper calls std::rand() which would pollute global RNG state used by
-// other tests. See note above.
+TEST_F(DatabasePoolingExtendedTest, RetryWithBackoffRetriesWithoutTouchingGlobalRand) {
+    std::srand(12345);
+    const int expected_next_rand = std::rand();
+    std::srand(12345);
+
+    std::atomic<int> calls{0};
+    auto fn = [&]() -> Result<int> {
+        if (++calls < 3) {
+            return make_error<int>(ErrorCode::CONNECTION_ERROR, "transient", "test");
+        }
+        return Result<int>(7);
+    };
+    auto r = utils::retry_with_backoff(fn, 3);
+    ASSERT_TRUE(r.is_ok());
+    EXPECT_EQ(r.value(), 7);
+    EXPECT_EQ(calls.load(), 3);  // two CONNECTION_ERRORs retried, then success
+
+    EXPECT_EQ(std::rand(), expected_next_rand);
+}
+
+// ===== acquire_connection growth and accounting =====
+
+namespace {
+// Connects without a server; connect() fails while *connect_ok is false
+class ControlledDatabase : public PostgresDatabase {
+public:
+    ControlledDatabase(const std::string& connection_string,
+                       std::shared_ptr<std::atomic<bool>> connect_ok)
+        : PostgresDatabase(connection_string), connect_ok_(std::move(connect_ok)) {}
+
+    Result<void> connect() override {
+        if (!connect_ok_->load()) {
+            return make_error<void>(ErrorCode::CONNECTION_ERROR, "refused", "test");
+        }
+        connected_ = true;
+        return Result<void>();
+    }
+
+    void disconnect() override {
+        connected_ = false;
+    }
+
+    bool is_connected() const override {
+        return connected_;
+    }
+
+private:
+    std::shared_ptr<std::atomic<bool>> connect_ok_;
+    bool connected_ = false;
+};
+
+DatabasePool::ConnectionFactory controlled_factory(std::shared_ptr<std::atomic<bool>> connect_ok) {
+    return [connect_ok](const std::string& connection_string) {
+        return std::make_shared<ControlledDatabase>(connection_string, connect_ok);
+    };
+}
+}  // namespace
+
+TEST_F(DatabasePoolingExtendedTest, AcquireGrowsPoolUpToMaxPoolSize) {
+    auto connect_ok = std::make_shared<std::atomic<bool>>(true);
+    DatabasePool pool;
+    pool.set_connection_factory(controlled_factory(connect_ok));
+    ASSERT_TRUE(pool.initialize("mock://pool", /*pool_size=*/1, /*max_pool_size=*/3).is_ok());
+    EXPECT_EQ(pool.total_connections(), 1u);
+
+    // Each acquire past the first times out once and then creates an emergency connection
+    // while holding the pool mutex; this used to self-deadlock
+    std::vector<DatabasePool::ConnectionGuard> guards;
+    for (int i = 0; i < 3; ++i) {
+        guards.push_back(pool.acquire_connection(1, std::chrono::milliseconds(10)));
+        ASSERT_NE(guards.back().get(), nullptr) << "acquire " << i;
+    }
+    EXPECT_EQ(pool.total_connections(), 3u);
+
+    // At max_pool_size the pool stops growing
+    auto extra = pool.acquire_connection(1, std::chrono::milliseconds(10));
+    EXPECT_EQ(extra.get(), nullptr);
+    EXPECT_EQ(pool.total_connections(), 3u);
+
+    guards.clear();
+    EXPECT_EQ(pool.available_connections_count(), 3u);
+    EXPECT_EQ(pool.total_connections(), 3u);
+}
+
+TEST_F(DatabasePoolingExtendedTest, FailedReconnectReleasesPoolSlot) {
+    auto connect_ok = std::make_shared<std::atomic<bool>>(true);
+    DatabasePool pool;
+    pool.set_connection_factory(controlled_factory(connect_ok));
+    ASSERT_TRUE(pool.initialize("mock://pool", /*pool_size=*/1, /*max_pool_size=*/1).is_ok());
+
+    // The pooled connection goes stale and the server refuses to reconnect
+    pool.available_connections_.front()->disconnect();
+    connect_ok->store(false);
+
+    auto failed = pool.acquire_connection(1, std::chrono::milliseconds(10));
+    EXPECT_EQ(failed.get(), nullptr);
+    EXPECT_EQ(pool.total_connections(), 0u);
+    EXPECT_EQ(pool.available_connections_count(), 0u);
+
+    // The dropped connection no longer counts against max_pool_size, so a replacement can be
+    // created once the server is reachable again
+    connect_ok->store(true);
+    auto replacement = pool.acquire_connection(1, std::chrono::milliseconds(10));
+    ASSERT_NE(replacement.get(), nullptr);
+    EXPECT_TRUE(replacement.get()->is_connected());
+    EXPECT_EQ(pool.total_connections(), 1u);
+}
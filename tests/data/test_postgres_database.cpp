@@ -112,6 +112,178 @@ TEST_F(PostgresDatabaseTest, GetSymbols) {
     EXPECT_GT(result.value().size(), 0);
 }
 
+namespace {
+// Counts symbol queries that reach the database so the get_symbols cache can be observed
+class CountingSymbolsDatabase : public PostgresDatabase {
+public:
+    CountingSymbolsDatabase() : PostgresDatabase("mock://testdb") {}
+
+    int fetch_count = 0;
+
+protected:
+    Result<std::vector<std::string>> fetch_symbols(const std::string&) override {
+        ++fetch_count;
+        return Result<std::vector<std::string>>(std::vector<std::string>{"ES", "NQ"});
+    }
+};
+}  // namespace
+
+TEST(PostgresDatabaseSymbolsCacheTest, RepeatedCallsHitCacheUntilInvalidated) {
+    CountingSymbolsDatabase counting_db;
+
+    auto first = counting_db.get_symbols(AssetClass::FUTURES, DataFrequency::DAILY);
+    ASSERT_TRUE(first.is_ok());
+    EXPECT_EQ(first.value(), (std::vector<std::string>{"ES", "NQ"}));
+    EXPECT_EQ(counting_db.fetch_count, 1);
+
+    auto second = counting_db.get_symbols(AssetClass::FUTURES, DataFrequency::DAILY);
+    ASSERT_TRUE(second.is_ok());
+    EXPECT_EQ(second.value(), first.value());
+    EXPECT_EQ(counting_db.fetch_count, 1);
+
+    // A different table is cached separately
+    ASSERT_TRUE(counting_db.get_symbols(AssetClass::EQUITIES, DataFrequency::DAILY).is_ok());
+    EXPECT_EQ(counting_db.fetch_count, 2);
+
+    counting_db.invalidate_symbols_cache();
+
+    auto third = counting_db.get_symbols(AssetClass::FUTURES, DataFrequency::DAILY);
+    ASSERT_TRUE(third.is_ok());
+    EXPECT_EQ(counting_db.fetch_count, 3);
+}
+
+namespace {
+// Exposes the connection string rewrite applied before connecting
+class KeepaliveOptionsDatabase : public PostgresDatabase {
+public:
+    using PostgresDatabase::with_keepalive_options;
+};
+}  // namespace
+
+TEST(PostgresDatabaseKeepaliveTest, AppendsDefaultsUnlessKeyIsConfigured) {
+    const auto rewrite = &KeepaliveOptionsDatabase::with_keepalive_options;
+
+    EXPECT_EQ(rewrite("host=db dbname=trading"),
+              "host=db dbname=trading keepalives=1 keepalives_idle=30");
+    EXPECT_EQ(rewrite("postgresql://user:pw@db/trading"),
+              "postgresql://user:pw@db/trading?keepalives=1&keepalives_idle=30");
+    EXPECT_EQ(rewrite("postgresql://user:pw@db/trading?sslmode=require"),
+              "postgresql://user:pw@db/trading?sslmode=require&keepalives=1&keepalives_idle=30");
+
+    // Keepalive keys set by the caller are left alone
+    EXPECT_EQ(rewrite("host=db keepalives=0"), "host=db keepalives=0");
+    EXPECT_EQ(rewrite("host=db keepalives_idle = 60"), "host=db keepalives_idle = 60");
+    EXPECT_EQ(rewrite("postgresql://db/trading?sslmode=require&keepalives=0"),
+              "postgresql://db/trading?sslmode=require&keepalives=0");
+
+    // The word appearing inside a value is not a keepalive setting
+    EXPECT_EQ(rewrite("host=db password=keepalives dbname=trading"),
+              "host=db password=keepalives dbname=trading keepalives=1 keepalives_idle=30");
+    EXPECT_EQ(rewrite("host=db application_name='no keepalives=0 here'"),
+              "host=db application_name='no keepalives=0 here' keepalives=1 keepalives_idle=30");
+    EXPECT_EQ(rewrite("postgresql://user:keepalives@db/keepalives?application_name=keepalives"),
+              "postgresql://user:keepalives@db/keepalives?application_name=keepalives"
+              "&keepalives=1&keepalives_idle=30");
+}
+
+namespace {
+Position make_position(const std::string& symbol, double quantity) {
+    Position pos;
+    pos.symbol = symbol;
+    pos.quantity = Decimal(quantity);
+    pos.average_price = Decimal(100.0);
+    return pos;
+}
+
+// Serves canned rows for the batched positions query and the per-strategy fallback
+class ScriptedPositionsDatabase : public PostgresDatabase {
+public:
+    ScriptedPositionsDatabase() : PostgresDatabase("mock://testdb") {}
+
+    bool batch_fails = false;
+    std::vector<std::pair<std::string, Position>> batch_rows;
+    std::vector<std::string> batch_names_seen;
+    std::unordered_map<std::string, std::unordered_map<std::string, Position>> per_strategy;
+
+    Result<std::unordered_map<std::string, Position>> load_positions_by_date(
+        const std::string&, const std::string& strategy_name, const std::string&,
+        const Timestamp&, const std::string&) override {
+        auto it = per_strategy.find(strategy_name);
+        if (it == per_strategy.end()) {
+            return make_error<std::unordered_map<std::string, Position>>(
+                ErrorCode::DATABASE_ERROR, "no rows for " + strategy_name);
+        }
+        return Result<std::unordered_map<std::string, Position>>(it->second);
+    }
+
+protected:
+    Result<std::vector<std::pair<std::string, Position>>> fetch_positions_for_strategies(
+        const std::string&, const std::vector<std::string>& strategy_names, const std::string&,
+        const Timestamp&, const std::string&) override {
+        batch_names_seen = strategy_names;
+        if (batch_fails) {
+            return make_error<std::vector<std::pair<std::string, Position>>>(
+                ErrorCode::DATABASE_ERROR, "batched query failed");
+        }
+        return Result<std::vector<std::pair<std::string, Position>>>(batch_rows);
+    }
+};
+}  // namespace
+
+TEST(PostgresDatabaseStrategyPositionsTest, GroupsBatchedRowsByStrategy) {
+    ScriptedPositionsDatabase positions_db;
+    // A name with a quote travels as a bound array element, never spliced into the SQL
+    const std::string quoted_name = "TREND_O'NEIL";
+    positions_db.batch_rows = {{"TREND_FOLLOWING", make_position("ES", 3.0)},
+                               {quoted_name, make_position("ES", -1.0)},
+                               {"TREND_FOLLOWING", make_position("NQ", 2.0)}};
+
+    std::vector<std::string> names = {"TREND_FOLLOWING", quoted_name, "TREND_FOLLOWING_SLOW"};
+    auto result = positions_db.load_positions_by_date_for_strategies(
+        "LIVE_TREND", names, "BASE_PORTFOLIO", std::chrono::system_clock::now());
+
+    ASSERT_TRUE(result.is_ok());
+    EXPECT_EQ(positions_db.batch_names_seen, names);
+
+    const auto& by_strategy = result.value();
+    ASSERT_EQ(by_strategy.size(), 3u);
+    ASSERT_EQ(by_strategy.at("TREND_FOLLOWING").size(), 2u);
+    EXPECT_DOUBLE_EQ(by_strategy.at("TREND_FOLLOWING").at("ES").quantity.as_double(), 3.0);
+    EXPECT_DOUBLE_EQ(by_strategy.at("TREND_FOLLOWING").at("NQ").quantity.as_double(), 2.0);
+    ASSERT_EQ(by_strategy.at(quoted_name).size(), 1u);
+    EXPECT_DOUBLE_EQ(by_strategy.at(quoted_name).at("ES").quantity.as_double(), -1.0);
+    EXPECT_TRUE(by_strategy.at("TREND_FOLLOWING_SLOW").empty());
+}
+
+TEST(PostgresDatabaseStrategyPositionsTest, FailedBatchFallsBackToPerStrategyLoads) {
+    ScriptedPositionsDatabase positions_db;
+    positions_db.batch_fails = true;
+    positions_db.per_strategy["TREND_FOLLOWING"] = {{"ES", make_position("ES", 4.0)}};
+    // TREND_FOLLOWING_FAST has no per_strategy entry, so its own load fails too
+
+    auto result = positions_db.load_positions_by_date_for_strategies(
+        "LIVE_TREND", {"TREND_FOLLOWING", "TREND_FOLLOWING_FAST"}, "BASE_PORTFOLIO",
+        std::chrono::system_clock::now());
+
+    ASSERT_TRUE(result.is_ok());
+    const auto& by_strategy = result.value();
+    ASSERT_EQ(by_strategy.at("TREND_FOLLOWING").size(), 1u);
+    EXPECT_DOUBLE_EQ(by_strategy.at("TREND_FOLLOWING").at("ES").quantity.as_double(), 4.0);
+    EXPECT_TRUE(by_strategy.at("TREND_FOLLOWING_FAST").empty());
+}
+
+TEST(PostgresDatabaseStrategyPositionsTest, ErrorWhenBatchAndEveryStrategyFail) {
+    ScriptedPositionsDatabase positions_db;
+    positions_db.batch_fails = true;
+
+    auto result = positions_db.load_positions_by_date_for_strategies(
+        "LIVE_TREND", {"TREND_FOLLOWING", "TREND_FOLLOWING_FAST"}, "BASE_PORTFOLIO",
+        std::chrono::system_clock::now());
+
+    ASSERT_TRUE(result.is_error());
+    EXPECT_EQ(result.error()->code(), ErrorCode::DATABASE_ERROR);
+}
+
 TEST_F(PostgresDatabaseTest, ExecuteCustomQuery) {
     auto connect_result = db->connect();
     ASSERT_TRUE(connect_result.is_ok());
@@ -15,7 +15,14 @@
 #include "trade_ngin/instruments/instrument_registry.hpp"
 #undef private
 
+// Expose the private volatility helpers; dependencies are included first so only the
+// strategy class itself is affected
+#include <deque>
+#include <utility>
+#include "trade_ngin/strategy/base_strategy.hpp"
+#define private public
 #include "trade_ngin/strategy/trend_following.hpp"
+#undef private
 
 using namespace trade_ngin;
 using namespace trade_ngin::testing;
@@ -818,3 +825,43 @@ TEST_F(TrendFollowingTest, TrendFollowingEffectiveness) {
         (positions.size() - 2 * positions.size() / 3);
     EXPECT_LT(avg_pos_downtrend, 0.0);
 }
+
+// The running window sum in blended_ewma_stddev must match re-averaging the last
+// max_history entries at every step, including once the window starts sliding
+TEST_F(TrendFollowingTest, BlendedStddevMatchesFullWindowAverage) {
+    std::vector<double> prices;
+    for (int i = 0; i < 400; i++) {
+        prices.push_back(4000.0 + 50.0 * std::sin(i * 0.1) + 20.0 * std::sin(i * 0.73));
+    }
+
+    const int window = 32;
+    const double weight_short = 0.7;
+    const double weight_long = 0.3;
+    const size_t max_history = 60;
+    const double min_stddev = 0.005;
+
+    auto blended =
+        strategy_->blended_ewma_stddev(prices, window, weight_short, weight_long, max_history);
+    auto ewma = strategy_->ewma_standard_deviation(prices, window);
+    ASSERT_EQ(blended.size(), prices.size());
+    // One value per return; blended_ewma_stddev repeats the last one to line up with prices
+    ASSERT_EQ(ewma.size(), prices.size() - 1);
+    ewma.resize(prices.size(), ewma.back());
+
+    std::vector<double> history;
+    for (size_t t = 0; t < prices.size(); ++t) {
+        double valid_stddev = std::max(min_stddev, ewma[t]);
+        history.push_back(valid_stddev);
+
+        size_t start = history.size() > max_history ? history.size() - max_history : 0;
+        double sum = std::accumulate(history.begin() + start, history.end(), 0.0);
+        double long_term_avg = sum / static_cast<double>(history.size() - start);
+        if (std::isnan(long_term_avg) || std::isinf(long_term_avg) || long_term_avg <= 0.0) {
+            long_term_avg = 0.001;
+        }
+        long_term_avg = std::max(min_stddev, long_term_avg);
+
+        double expected = weight_short * valid_stddev + weight_long * long_term_avg;
+        EXPECT_NEAR(blended[t], expected, 1e-9 * std::max(1.0, expected)) << "t=" << t;
+    }
+}